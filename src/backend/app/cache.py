@@ -0,0 +1,74 @@
+# Copyright (c) 2022, 2023 Humanitarian OpenStreetMap Team
+#
+# This file is part of FMTM.
+#
+#     FMTM is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     FMTM is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with FMTM.  If not, see <https:#www.gnu.org/licenses/>.
+#
+"""In-process caches for data that changes rarely."""
+
+from time import monotonic
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """A size bounded cache whose entries expire after ttl seconds.
+
+    The oldest entries are evicted once maxsize entries, or maxbytes
+    (the total nbytes passed to set), are reached.
+    Each worker process holds its own copy.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 4096, maxbytes: Optional[int] = None):
+        """Create an empty cache."""
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self._nbytes = 0
+        # key: (expiry, value, nbytes), in insertion order
+        self._data: dict[Hashable, tuple[float, Any, int]] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a value, or None if missing or expired."""
+        entry = self._data.get(key)
+        if not entry:
+            return None
+        if entry[0] > monotonic():
+            return entry[1]
+        # Free the memory of expired entries
+        self.invalidate(key)
+        return None
+
+    def set(self, key: Hashable, value: Any, nbytes: int = 0) -> None:
+        """Store a value, evicting the oldest entries if full.
+
+        Values larger than maxbytes are not stored.
+        """
+        self.invalidate(key)
+        if self.maxbytes is not None and nbytes > self.maxbytes:
+            return
+        while self._data and (
+            len(self._data) >= self.maxsize
+            or (self.maxbytes is not None and self._nbytes + nbytes > self.maxbytes)
+        ):
+            self.invalidate(next(iter(self._data)))
+        self._data[key] = (monotonic() + self.ttl, value, nbytes)
+        self._nbytes += nbytes
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop a single entry, or all entries if no key is given."""
+        if key is None:
+            self._data.clear()
+            self._nbytes = 0
+        elif entry := self._data.pop(key, None):
+            self._nbytes -= entry[2]
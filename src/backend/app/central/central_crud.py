@@ -24,6 +24,7 @@ from typing import Optional, Union
 
 from defusedxml import ElementTree
 from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
 from loguru import logger as log
 from osm_fieldwork.CSVDump import CSVDump
 from osm_fieldwork.OdkCentral import OdkAppUser, OdkForm, OdkProject
@@ -143,7 +144,7 @@ def create_odk_project(
         ) from e
 
 
-async def delete_odk_project(
+def delete_odk_project(
     project_id: int, odk_central: Optional[project_schemas.ODKCentralDecrypted] = None
 ):
     """Delete a project from a remote ODK Server."""
@@ -338,9 +339,13 @@ async def update_odk_xforms(
     form_file_ext: str,
     form_name_prefix: str,
     odk_credentials: project_schemas.ODKCentralDecrypted,
+    concurrency: int = 4,
 ) -> bool:
     """Asyncio update XForm data for each ODK Form in project.
 
+    The forms are split into batches, each updated over its own
+    ODK Central session, with the batches running concurrently.
+
     Args:
         task_list (List[int]): List of task IDs.
         odk_id (int): ODK Central form ID.
@@ -348,24 +353,31 @@ async def update_odk_xforms(
         form_file_ext (str): Extension of the form file.
         form_name_prefix (str): Prefix for the form name in ODK Central.
         odk_credentials (project_schemas.ODKCentralDecrypted): ODK Central creds.
+        concurrency (int): Max number of forms updated at the same time.
 
     Returns:
         bool: True if the update is successful.
     """
-    coroutines = []
+    # Convert the form once, then reuse it for every task form
+    xform_data = await read_and_test_xform(
+        xform_data,
+        form_file_ext,
+        return_form_data=True,
+    )
 
-    for task_id in task_list:
-        coro = update_and_publish_form(
-            task_id,
-            odk_id,
-            xform_data,
-            form_file_ext,
-            form_name_prefix,
-            odk_credentials,
+    batch_count = max(1, min(concurrency, len(task_list)))
+    await gather(
+        *(
+            update_and_publish_forms(
+                task_list[index::batch_count],
+                odk_id,
+                xform_data,
+                form_name_prefix,
+                odk_credentials,
+            )
+            for index in range(batch_count)
         )
-        coroutines.append(coro)
-
-    await gather(*coroutines)
+    )
 
     log.info(
         f"{len(task_list)} XForms updated in ODK Central for: ({form_name_prefix})"
@@ -374,52 +386,50 @@ async def update_odk_xforms(
     return True
 
 
-async def update_and_publish_form(
-    task_id: int,
+async def update_and_publish_forms(
+    task_ids: list[int],
     odk_id: int,
     xform_data: BytesIO,
-    form_file_ext: str,
     form_name_prefix: str,
     odk_credentials: project_schemas.ODKCentralDecrypted,
 ) -> None:
-    """Update and publish the XForm for a specific task.
+    """Update and publish the XForms for a batch of tasks.
+
+    Logs in to ODK Central once and reuses the session for every form.
+    The blocking ODK Central calls run in the threadpool.
 
     Args:
-        task_id (int): Task ID.
+        task_ids (list[int]): Task IDs.
         odk_id (int): ODK Central form ID.
-        xform_data (BytesIO): XForm data.
-        form_file_ext (str): Extension of the form file.
+        xform_data (BytesIO): XForm data, already converted from XLSForm.
         form_name_prefix (str): Prefix for the form name in ODK Central.
         odk_credentials (project_schemas.ODKCentralDecrypted): ODK Central creds.
     """
-    odk_form_name = f"{form_name_prefix}_task_{task_id}"
-    xform_data = await read_and_test_xform(
-        xform_data,
-        form_file_ext,
-        return_form_data=True,
-    )
-    updated_xform_data = await update_xform_info(
-        xform_data,
-        odk_form_name,
-        f"{odk_form_name}.geojson",
-    )
-
     try:
-        xform = get_odk_form(odk_credentials)
+        xform = await run_in_threadpool(get_odk_form, odk_credentials)
     except Exception as e:
         log.error(e)
         raise HTTPException(
             status_code=500, detail={"message": "Connection failed to odk central"}
         ) from e
 
-    # NOTE calling createForm with the form_name specified should update
-    xform.createForm(
-        odk_id,
-        updated_xform_data,
-        odk_form_name,
-    )
-    # The draft form must be published after upload
-    xform.publishForm(odk_id, odk_form_name)
+    for task_id in task_ids:
+        odk_form_name = f"{form_name_prefix}_task_{task_id}"
+        updated_xform_data = await update_xform_info(
+            xform_data,
+            odk_form_name,
+            f"{odk_form_name}.geojson",
+        )
+
+        # NOTE calling createForm with the form_name specified should update
+        await run_in_threadpool(
+            xform.createForm,
+            odk_id,
+            updated_xform_data,
+            odk_form_name,
+        )
+        # The draft form must be published after upload
+        await run_in_threadpool(xform.publishForm, odk_id, odk_form_name)
 
 
 def download_submissions(
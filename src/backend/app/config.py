@@ -183,8 +183,14 @@ def encrypt_value(password: Union[str, HttpUrlStr]) -> str:
     return base64.b64encode(encrypted_password).decode("utf-8")
 
 
+@lru_cache(maxsize=512)
 def decrypt_value(db_password: str) -> str:
-    """Decrypt the database value."""
+    """Decrypt the database value.
+
+    Cached by ciphertext, as credentials and task tokens are decrypted
+    on every read. A changed value is a new ciphertext (and cache key),
+    so no invalidation is needed.
+    """
     cipher_suite = get_cipher_suite()
     encrypted_password = base64.b64decode(db_password.encode("utf-8"))
     decrypted_password = cipher_suite.decrypt(encrypted_password)
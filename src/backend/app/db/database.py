@@ -26,7 +26,11 @@ from app.config import settings
 engine = create_engine(
     settings.FMTM_DB_URL.unicode_string(),
     pool_size=20,
-    max_overflow=-1,
+    # Queue requests rather than exceed Postgres max_connections under load
+    max_overflow=30,
+    # Drop connections closed by the server while idle, instead of erroring
+    pool_pre_ping=True,
+    pool_recycle=300,
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -17,6 +17,7 @@
 #
 """SQLAlchemy database models for interacting with Postgresql."""
 
+import uuid
 from datetime import datetime
 from typing import cast
 
@@ -38,9 +39,10 @@ from sqlalchemy import (
     Table,
     UniqueConstraint,
     desc,
+    func,
 )
 from sqlalchemy.dialects.postgresql import ARRAY as PostgreSQLArray  # noqa: N811
-from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.orm import (
     # declarative_base,
     backref,
@@ -243,6 +245,13 @@ class DbProjectInfo(Base):
 
     __table_args__ = (
         Index("textsearch_idx", "text_searchable"),
+        Index("idx_project_info_name_lower", func.lower(name), unique=True),
+        Index(
+            "idx_project_info_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
         {},
     )
 
@@ -374,6 +383,8 @@ class DbTaskHistory(Base):
             nullable=False,
         ),
     )
+    # Status the task changed to, null for other actions such as comments
+    new_status = cast(TaskStatus, Column(Enum(TaskStatus)))
 
     # Define relationships
     user = relationship(DbUser, uselist=False, backref="task_history_user")
@@ -389,6 +400,13 @@ class DbTaskHistory(Base):
         ),
         Index("idx_task_history_composite", "task_id", "project_id"),
         Index("idx_task_history_project_id_user_id", "user_id", "project_id"),
+        Index("idx_task_history_project_id_action_date", "project_id", "action_date"),
+        Index(
+            "idx_task_history_comments",
+            project_id,
+            task_id,
+            postgresql_where=action == TaskAction.COMMENT,
+        ),
         {},
     )
 
@@ -450,6 +468,7 @@ class DbTask(Base):
         ),
     )
     odk_token = cast(str, Column(String, nullable=True))
+    version_id = cast(int, Column(Integer, nullable=False, server_default="1"))
 
     # Define relationships
     task_history = relationship(
@@ -458,6 +477,9 @@ class DbTask(Base):
     lock_holder = relationship(DbUser, foreign_keys=[locked_by])
     mapper = relationship(DbUser, foreign_keys=[mapped_by])
 
+    # UPDATEs match on the version they read, concurrent changes raise
+    __mapper_args__ = {"version_id_col": version_id}
+
     ## ---------------------------------------------- ##
     # FOR REFERENCE: OTHER ATTRIBUTES IN TASKING MANAGER
     # x = Column(Integer)
@@ -476,6 +498,12 @@ class DbProject(Base):
 
     # Columns
     id = cast(int, Column(Integer, primary_key=True))
+    project_uuid = cast(
+        uuid.UUID,
+        Column(
+            UUID(as_uuid=True), server_default=func.gen_random_uuid(), nullable=False
+        ),
+    )
     odkid = cast(int, Column(Integer))
     organisation_id = cast(
         int,
@@ -587,6 +615,7 @@ class DbProject(Base):
 
     __table_args__ = (
         Index("idx_geometry", outline, postgresql_using="gist"),
+        Index("idx_projects_hashtags", "hashtags", postgresql_using="gin"),
         {},
     )
 
@@ -713,3 +742,8 @@ class DbTilesPath(Base):
     tile_source = cast(str, Column(String))
     background_task_id = cast(str, Column(String))
     created_at = cast(datetime, Column(DateTime, default=timestamp))
+
+    __table_args__ = (
+        Index("idx_mbtiles_path_project_id", "project_id", desc("id")),
+        {},
+    )
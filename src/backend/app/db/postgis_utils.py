@@ -20,12 +20,13 @@
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Optional, Union
+from typing import Iterator, Optional, Union
 from uuid import uuid4
 
 import geojson
-import requests
+import shapely
 from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
 from geoalchemy2 import WKBElement
 from geoalchemy2.shape import from_shape, to_shape
 from geojson_pydantic import Feature, Polygon
@@ -35,8 +36,18 @@ from sqlalchemy import text
 from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.orm import Session
 
+from app.http_client import http_session
+
 log = logging.getLogger(__name__)
 
+VALID_CRS = frozenset(
+    {
+        "urn:ogc:def:crs:OGC:1.3:CRS84",
+        "urn:ogc:def:crs:EPSG::4326",
+        "WGS 84",
+    }
+)
+
 
 def timestamp():
     """Get the current time.
@@ -110,6 +121,12 @@ def geojson_to_geometry(
     return from_shape(shapely_geom)
 
 
+def geojson_to_wkb_hex(geometries: list[dict]) -> list[str]:
+    """Convert GeoJSON geometries to hex WKB, encoded in a single vectorised call."""
+    shapes = [shape(geometry) for geometry in geometries]
+    return shapely.to_wkb(shapes, hex=True).tolist()
+
+
 def read_wkb(wkb: WKBElement):
     """Load a WKBElement and return a shapely geometry."""
     return to_shape(wkb)
@@ -249,6 +266,169 @@ async def flatgeobuf_to_geojson(
     return None
 
 
+async def flatgeobuf_to_geojson_stream(
+    db: Session, flatgeobuf: bytes, precision: int = 6, batch_size: int = 1000
+) -> Optional[Iterator[bytes]]:
+    """Converts FlatGeobuf data to a stream of GeoJSON bytes.
+
+    Each feature is serialised by PostGIS and fetched from a server-side
+    cursor in batches, so the full FeatureCollection is never held in memory.
+
+    Args:
+        db (Session): SQLAlchemy db session.
+        flatgeobuf (bytes): FlatGeobuf data in bytes format.
+        precision (int): Max decimal places in the coordinates.
+            6 is ~10cm, plenty for mapping and far smaller than the default 9.
+        batch_size (int): Number of features fetched per round trip.
+
+    Returns:
+        Iterator[bytes]: Chunks of a GeoJSON FeatureCollection, or None.
+    """
+    # A temp table per call, as the shared public.temp_fgb would stay
+    # exclusively locked for the whole download. Only its row type is used.
+    fgb_table = f"temp_fgb_{uuid4().hex}"
+    create_sql = text(
+        """
+        SELECT ST_FromFlatGeobufToTable('pg_temp', :fgb_table, :fgb_bytes);
+    """
+    )
+    drop_sql = text(f"DROP TABLE IF EXISTS pg_temp.{fgb_table};")
+    features_sql = text(
+        f"""
+        SELECT jsonb_build_object(
+            'type', 'Feature',
+            'geometry', ST_AsGeoJSON(
+                ST_GeometryN(fgb_data.geom, 1), :precision
+            )::jsonb,
+            'id', fgb_data.osm_id,
+            'properties', jsonb_build_object(
+                'osm_id', fgb_data.osm_id,
+                'tags', fgb_data.tags,
+                'version', fgb_data.version,
+                'changeset', fgb_data.changeset,
+                'timestamp', fgb_data.timestamp
+            )::jsonb
+        )::text
+        FROM ST_FromFlatGeobuf(null::pg_temp.{fgb_table}, :fgb_bytes) AS fgb_data;
+    """
+    ).execution_options(yield_per=batch_size)
+
+    try:
+        db.execute(create_sql, {"fgb_table": fgb_table, "fgb_bytes": flatgeobuf})
+        result = db.execute(
+            features_sql, {"fgb_bytes": flatgeobuf, "precision": precision}
+        )
+    except ProgrammingError as e:
+        log.error(e)
+        log.error(
+            "Attempted flatgeobuf --> geojson conversion failed. "
+            "Perhaps there is a duplicate 'id' column?"
+        )
+        return None
+
+    def generate_chunks() -> Iterator[bytes]:
+        try:
+            yield b'{"type":"FeatureCollection","features":['
+            separator = b""
+            for rows in result.partitions():
+                yield separator + b",".join(row[0].encode() for row in rows)
+                separator = b","
+            yield b"]}"
+        finally:
+            # Also if the client disconnects mid download
+            result.close()
+            db.execute(drop_sql)
+
+    return generate_chunks()
+
+
+async def flatgeobuf_to_task_geojson(
+    db: Session,
+    flatgeobuf: bytes,
+    project_id: int,
+    task_id: int,
+    precision: int = 6,
+) -> Optional[str]:
+    """Converts the FlatGeobuf features within a task area to GeoJSON.
+
+    Filtering and serialisation both happen in PostGIS, returning the
+    FeatureCollection text, so no features are parsed in Python.
+    Features are tagged as in split_geojson_by_task_areas.
+
+    Args:
+        db (Session): SQLAlchemy db session.
+        flatgeobuf (bytes): FlatGeobuf data in bytes format.
+        project_id (int): The project ID for the task.
+        task_id (int): The task to extract features for.
+        precision (int): Max decimal places in the coordinates.
+
+    Returns:
+        str: A GeoJSON FeatureCollection, or None if conversion failed.
+    """
+    create_sql = text(
+        """
+        DROP TABLE IF EXISTS public.temp_fgb CASCADE;
+        SELECT ST_FromFlatGeobufToTable('public', 'temp_fgb', :fgb_bytes);
+    """
+    )
+    features_sql = text(
+        """
+        SELECT jsonb_build_object(
+            'type', 'FeatureCollection',
+            'features', COALESCE(jsonb_agg(
+                jsonb_build_object(
+                    'type', 'Feature',
+                    'geometry', ST_AsGeoJSON(fgb_data.geom, :precision)::jsonb,
+                    'id', fgb_data.osm_id::VARCHAR,
+                    'properties', jsonb_build_object(
+                        'osm_id', fgb_data.osm_id,
+                        'tags', fgb_data.tags,
+                        'version', fgb_data.version,
+                        'changeset', fgb_data.changeset,
+                        'timestamp', fgb_data.timestamp,
+                        'task_id', tasks.id,
+                        'project_id', tasks.project_id,
+                        'title', CONCAT(
+                            'project_', tasks.project_id, '_task_', tasks.id
+                        )
+                    )
+                )
+            ), '[]'::jsonb)
+        )::text
+        FROM (
+            SELECT DISTINCT ON (geom)
+                ST_SetSRID(ST_GeometryN(geom, 1), 4326) AS geom,
+                osm_id,
+                tags,
+                version,
+                changeset,
+                timestamp
+            FROM ST_FromFlatGeobuf(null::temp_fgb, :fgb_bytes)
+        ) AS fgb_data
+        JOIN tasks
+            ON tasks.id = :task_id
+            AND tasks.project_id = :project_id
+        WHERE ST_Within(fgb_data.geom, tasks.outline);
+    """
+    )
+
+    try:
+        db.execute(create_sql, {"fgb_bytes": flatgeobuf})
+        return db.execute(
+            features_sql,
+            {
+                "fgb_bytes": flatgeobuf,
+                "project_id": project_id,
+                "task_id": task_id,
+                "precision": precision,
+            },
+        ).scalar()
+    except ProgrammingError as e:
+        log.error(e)
+        log.error(f"Attempted flatgeobuf --> geojson for task ({task_id}) failed")
+        return None
+
+
 async def split_geojson_by_task_areas(
     db: Session,
     featcol: geojson.FeatureCollection,
@@ -457,16 +637,12 @@ def get_featcol_main_geom_type(featcol: geojson.FeatureCollection) -> str:
 
 
 async def check_crs(input_geojson: Union[dict, geojson.FeatureCollection]):
-    """Validate CRS is valid for a geojson."""
-    log.debug("validating coordinate reference system")
+    """Validate CRS is valid for a geojson.
 
-    def is_valid_crs(crs_name):
-        valid_crs_list = [
-            "urn:ogc:def:crs:OGC:1.3:CRS84",
-            "urn:ogc:def:crs:EPSG::4326",
-            "WGS 84",
-        ]
-        return crs_name in valid_crs_list
+    Only the crs member, or else a single coordinate, is inspected,
+    so the cost does not depend on the number of features.
+    """
+    log.debug("validating coordinate reference system")
 
     def is_valid_coordinate(coord):
         if coord is None:
@@ -479,7 +655,7 @@ async def check_crs(input_geojson: Union[dict, geojson.FeatureCollection]):
     )
     if "crs" in input_geojson:
         crs = input_geojson.get("crs", {}).get("properties", {}).get("name")
-        if not is_valid_crs(crs):
+        if crs not in VALID_CRS:
             log.error(error_message)
             raise HTTPException(status_code=400, detail=error_message)
         return
@@ -518,7 +694,7 @@ def get_address_from_lat_lon(latitude, longitude):
     headers = {"Accept-Language": "en"}  # Set the language to English
 
     log.debug("Getting Nominatim address from project centroid")
-    response = requests.get(base_url, params=params, headers=headers)
+    response = http_session().get(base_url, params=params, headers=headers)
     if (status_code := response.status_code) != 200:
         log.error(f"Getting address string failed: {status_code}")
         return None
@@ -544,5 +720,5 @@ def get_address_from_lat_lon(latitude, longitude):
 
 
 async def get_address_from_lat_lon_async(latitude, longitude):
-    """Async wrapper for get_address_from_lat_lon."""
-    return get_address_from_lat_lon(latitude, longitude)
+    """Async wrapper for get_address_from_lat_lon, run in the threadpool."""
+    return await run_in_threadpool(get_address_from_lat_lon, latitude, longitude)
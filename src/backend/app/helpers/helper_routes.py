@@ -17,8 +17,6 @@
 #
 """Routes to help with common processes in the FMTM workflow."""
 
-import json
-
 from fastapi import (
     APIRouter,
     Depends,
@@ -26,6 +24,7 @@ from fastapi import (
 )
 from fastapi.exceptions import HTTPException
 from fastapi.responses import Response
+from pydantic_core import to_json
 
 from app.auth.osm import AuthUser, login_required
 from app.db.postgis_utils import (
@@ -66,7 +65,7 @@ async def append_required_geojson_properties(
             "Content-Disposition": ("attachment; filename=geojson_withtags.geojson"),
             "Content-Type": "application/media",
         }
-        return Response(content=json.dumps(processed_featcol), headers=headers)
+        return Response(content=to_json(processed_featcol), headers=headers)
 
     raise HTTPException(
         status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
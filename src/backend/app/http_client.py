@@ -0,0 +1,46 @@
+# Copyright (c) 2022, 2023 Humanitarian OpenStreetMap Team
+#
+# This file is part of FMTM.
+#
+#     FMTM is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     FMTM is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with FMTM.  If not, see <https:#www.gnu.org/licenses/>.
+#
+"""Shared HTTP session for outbound requests."""
+
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+@lru_cache(maxsize=1)
+def http_session() -> requests.Session:
+    """Get the process wide requests session.
+
+    Reuses keep-alive connections across calls, instead of a new
+    TCP and TLS handshake per request. requests is blocking, so call
+    it from the threadpool when in async code.
+    """
+    session = requests.Session()
+    # Pool sized to match the default FastAPI threadpool (40 threads)
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=40)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def close_http_session() -> None:
+    """Close pooled connections, on shutdown."""
+    if http_session.cache_info().currsize:
+        http_session().close()
+        http_session.cache_clear()
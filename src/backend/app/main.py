@@ -20,14 +20,18 @@
 import logging
 import sys
 from contextlib import asynccontextmanager
+from typing import Any
 
 import sentry_sdk
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
 from loguru import logger as log
 from osm_fieldwork.xlsforms import xlsforms_path
+from pydantic_core import to_json
+from starlette.types import Receive, Scope, Send
 
 from app.__version__ import __version__
 from app.auth import auth_routes
@@ -35,12 +39,18 @@ from app.central import central_routes
 from app.config import settings
 from app.db.database import get_db
 from app.helpers import helper_routes
+from app.http_client import close_http_session
 from app.models.enums import HTTPStatus
 from app.organisations import organisation_routes
 from app.organisations.organisation_crud import init_admin_org
 from app.projects import project_routes
-from app.projects.project_crud import read_xlsforms
+from app.projects.project_crud import (
+    create_project_log_filter,
+    read_xlsforms,
+    shutdown_project_files_pool,
+)
 from app.submissions import submission_routes
+from app.submissions.submission_crud import shutdown_submissions_pool
 from app.tasks import tasks_routes
 from app.users import user_routes
 
@@ -67,6 +77,37 @@ async def lifespan(app: FastAPI):
 
     # Shutdown events
     log.debug("Shutting down FastAPI server.")
+    close_http_session()
+    shutdown_project_files_pool()
+    shutdown_submissions_pool()
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered by the pydantic-core Rust serialiser.
+
+    Faster than the stdlib json module for large nested payloads.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serialise content to compact UTF-8 JSON bytes."""
+        return to_json(content)
+
+
+class ArchiveSkippingGZipMiddleware(GZipMiddleware):
+    """GZip responses, except for basemap archive downloads.
+
+    The archives are large and hold already compressed tiles, so gzip
+    would only burn CPU and drop the Content-Length header.
+    """
+
+    skip_paths = ("/projects/download_tiles/",)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Pass skipped paths straight through to the app."""
+        if scope["type"] == "http" and scope["path"].endswith(self.skip_paths):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
 
 
 def get_application() -> FastAPI:
@@ -82,6 +123,7 @@ def get_application() -> FastAPI:
         debug=settings.DEBUG,
         lifespan=lifespan,
         root_path=settings.API_PREFIX,
+        default_response_class=FastJSONResponse,
     )
 
     # Set custom logger
@@ -95,6 +137,10 @@ def get_application() -> FastAPI:
         allow_headers=["*"],
         expose_headers=["Content-Disposition"],
     )
+    # GeoJSON and XML bodies compress 5-10x; small bodies are not worth it
+    _app.add_middleware(
+        ArchiveSkippingGZipMiddleware, minimum_size=1024, compresslevel=5
+    )
 
     _app.include_router(user_routes.router)
     _app.include_router(project_routes.router)
@@ -142,6 +188,8 @@ def get_logger():
             "| {name}:{function}:{line} | {message}"
         ),
         enqueue=True,  # Run async / non-blocking
+        # Picklable, so the logger can be shared with spawned worker processes
+        context="spawn",
         colorize=True,
         backtrace=True,  # More detailed tracebacks
         catch=True,  # Prevent app crashes
@@ -153,6 +201,7 @@ def get_logger():
             "/opt/logs/fmtm.json",
             level=settings.LOG_LEVEL,
             enqueue=True,
+            context="spawn",
             serialize=True,  # JSON format
             rotation="00:00",  # New file at midnight
             retention="10 days",
@@ -163,10 +212,11 @@ def get_logger():
         "/opt/logs/create_project.json",
         level=settings.LOG_LEVEL,
         enqueue=True,
+        context="spawn",
         serialize=True,
         rotation="00:00",
         retention="10 days",
-        filter=lambda record: record["extra"].get("task") == "create_project",
+        filter=create_project_log_filter,
     )
 
 
@@ -209,7 +259,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
                 "error": error["msg"] + str([x for x in error["loc"]]),
             }
         )
-    return JSONResponse(status_code=status_code, content={"errors": errors})
+    return FastJSONResponse(status_code=status_code, content={"errors": errors})
 
 
 @api.get("/")
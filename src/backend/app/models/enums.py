@@ -41,6 +41,9 @@ class HTTPStatus(IntEnum):
     ACCEPTED = 202
     NO_CONTENT = 204
 
+    # Redirection
+    NOT_MODIFIED = 304
+
     # Client Error
     BAD_REQUEST = 400
     UNAUTHORIZED = 401
@@ -158,40 +161,32 @@ class TaskStatus(IntEnum, Enum):
     ARCHIVED = 8  # When new replacement task has been uploaded
 
 
+# Allowed new statuses, keyed by the current status
+VALID_STATUS_TRANSITIONS: dict[TaskStatus, frozenset[TaskStatus]] = {
+    TaskStatus.READY: frozenset(
+        {TaskStatus.LOCKED_FOR_MAPPING, TaskStatus.BAD, TaskStatus.SPLIT}
+    ),
+    TaskStatus.LOCKED_FOR_MAPPING: frozenset(
+        {TaskStatus.READY, TaskStatus.MAPPED, TaskStatus.BAD, TaskStatus.SPLIT}
+    ),
+    TaskStatus.MAPPED: frozenset(
+        {TaskStatus.LOCKED_FOR_MAPPING, TaskStatus.LOCKED_FOR_VALIDATION}
+    ),
+    TaskStatus.LOCKED_FOR_VALIDATION: frozenset(
+        {TaskStatus.INVALIDATED, TaskStatus.VALIDATED}
+    ),
+    TaskStatus.VALIDATED: frozenset({TaskStatus.INVALIDATED}),
+    TaskStatus.INVALIDATED: frozenset(
+        {TaskStatus.LOCKED_FOR_MAPPING, TaskStatus.BAD, TaskStatus.SPLIT}
+    ),
+    TaskStatus.BAD: frozenset({TaskStatus.ARCHIVED}),
+    TaskStatus.SPLIT: frozenset({TaskStatus.ARCHIVED}),
+}
+
+
 def verify_valid_status_update(old_status: TaskStatus, new_status: TaskStatus):
     """Verify the status update is valid, inferred from previous state."""
-    if old_status is TaskStatus.READY:
-        return new_status in [
-            TaskStatus.LOCKED_FOR_MAPPING,
-            TaskStatus.BAD,
-            TaskStatus.SPLIT,
-        ]
-    elif old_status is TaskStatus.LOCKED_FOR_MAPPING:
-        return new_status in [
-            TaskStatus.READY,
-            TaskStatus.MAPPED,
-            TaskStatus.BAD,
-            TaskStatus.SPLIT,
-        ]
-    elif old_status is TaskStatus.MAPPED:
-        return new_status in [
-            TaskStatus.LOCKED_FOR_MAPPING,
-            TaskStatus.LOCKED_FOR_VALIDATION,
-        ]
-    elif old_status is TaskStatus.LOCKED_FOR_VALIDATION:
-        return new_status in [TaskStatus.INVALIDATED, TaskStatus.VALIDATED]
-    elif old_status is TaskStatus.VALIDATED:
-        return new_status == TaskStatus.INVALIDATED
-    elif old_status is TaskStatus.INVALIDATED:
-        return new_status in [
-            TaskStatus.LOCKED_FOR_MAPPING,
-            TaskStatus.BAD,
-            TaskStatus.SPLIT,
-        ]
-    elif old_status is TaskStatus.BAD:
-        return new_status == TaskStatus.ARCHIVED
-    elif old_status is TaskStatus.SPLIT:
-        return new_status == TaskStatus.ARCHIVED
+    return new_status in VALID_STATUS_TRANSITIONS.get(old_status, frozenset())
 
 
 class TaskAction(IntEnum, Enum):
@@ -33,6 +33,7 @@ from app.db import database
 from app.db.db_models import DbOrganisation, DbUser
 from app.organisations import organisation_crud, organisation_schemas
 from app.organisations.organisation_deps import org_exists
+from app.projects.project_deps import invalidate_odk_credentials
 from app.users.user_deps import user_exists_in_db
 
 router = APIRouter(
@@ -115,9 +116,12 @@ async def update_organisation(
     org_user_dict: DbUser = Depends(org_admin),
 ):
     """Partial update for an existing organisation."""
-    return await organisation_crud.update_organisation(
+    updated_org = await organisation_crud.update_organisation(
         db, organisation, new_values, logo
     )
+    # Projects may fall back to the org ODK credentials
+    invalidate_odk_credentials()
+    return updated_org
 
 
 @router.delete("/{org_id}")
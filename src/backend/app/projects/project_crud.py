@@ -20,22 +20,23 @@
 import json
 import os
 import uuid
-from asyncio import gather
-from concurrent.futures import ThreadPoolExecutor, wait
+from asyncio import gather, get_running_loop
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import lru_cache, partial
+from hashlib import sha256
 from importlib.resources import files as pkg_files
 from io import BytesIO
-from typing import List, Optional, Union
+from multiprocessing import get_context
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Iterator, List, Optional, Union
 
-import geoalchemy2
 import geojson
-import requests
-import shapely.wkb as wkblib
 import sozipfile.sozipfile as zipfile
 from asgiref.sync import async_to_sync
 from fastapi import HTTPException, Response
 from fastapi.concurrency import run_in_threadpool
 from fmtm_splitter.splitter import split_by_sql, split_by_square
-from geoalchemy2.shape import to_shape
 from geojson.feature import Feature, FeatureCollection
 from loguru import logger as log
 from osm_fieldwork.basemapper import create_basemap_file
@@ -43,81 +44,198 @@ from osm_fieldwork.json2osm import json2osm
 from osm_fieldwork.OdkCentral import OdkAppUser
 from osm_fieldwork.xlsforms import xlsforms_path
 from osm_rawdata.postgres import PostgresClient
+from pydantic_core import from_json, to_json
 from shapely import wkt
 from shapely.geometry import (
     Polygon,
     shape,
 )
-from sqlalchemy import and_, column, func, inspect, select, table, text
+from sqlalchemy import column, func, inspect, select, table, text, true, update
 from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
 
+from app.cache import TTLCache
 from app.central import central_crud
 from app.config import encrypt_value, settings
 from app.db import db_models
-from app.db.database import get_db
+from app.db.database import SessionLocal, get_db
 from app.db.postgis_utils import (
     check_crs,
     flatgeobuf_to_geojson,
+    flatgeobuf_to_geojson_stream,
+    flatgeobuf_to_task_geojson,
     geojson_to_flatgeobuf,
+    geojson_to_wkb_hex,
     geometry_to_geojson,
     get_address_from_lat_lon_async,
     get_featcol_main_geom_type,
     parse_and_filter_geojson,
     split_geojson_by_task_areas,
 )
-from app.models.enums import HTTPStatus, ProjectRole
+from app.http_client import http_session
+from app.models.enums import (
+    BackgroundTaskStatus,
+    HTTPStatus,
+    ProjectRole,
+    TaskStatus,
+)
 from app.projects import project_deps, project_schemas
 from app.s3 import add_obj_to_bucket, get_obj_from_bucket
 from app.tasks import tasks_crud
-from app.users import user_crud
 
 TILESDIR = "/opt/tiles"
 
+# NOTE spawn avoids forking the running event loop and db connection pool
+GEOM_POOL = ProcessPoolExecutor(mp_context=get_context("spawn"))
+# Basemap jobs run for minutes, so get their own small pool and queue up
+TILES_POOL = ProcessPoolExecutor(max_workers=2, mp_context=get_context("spawn"))
 
-async def get_projects(
-    db: Session,
-    skip: int = 0,
-    limit: int = 100,
+
+def create_project_log_filter(record) -> bool:
+    """Keep only the project creation logs, read by generate-log.
+
+    A module level function, not a lambda, so the sink using it
+    can be pickled to the worker processes.
+    """
+    return record["extra"].get("task") == "create_project"
+
+
+def init_worker_logger(logger) -> None:
+    """Send a worker process' logs to the parent process' loguru sinks.
+
+    Required for the project creation logs read by generate-log.
+    The sinks must be added with context="spawn" to be picklable.
+    """
+    # A spawned worker imports a fresh, unconfigured logger
+    global log
+    log = logger
+
+
+@lru_cache(maxsize=1)
+def project_files_pool() -> ProcessPoolExecutor:
+    """Get the pool generating the forms, app users and extracts of new projects.
+
+    Created on first use, so it is recreated if the app restarts
+    after shutdown_project_files_pool.
+    """
+    return ProcessPoolExecutor(
+        max_workers=2,
+        mp_context=get_context("spawn"),
+        initializer=init_worker_logger,
+        initargs=(log,),
+    )
+
+
+def shutdown_project_files_pool() -> None:
+    """Stop the project files worker processes, on shutdown."""
+    if project_files_pool.cache_info().currsize:
+        project_files_pool().shutdown()
+        project_files_pool.cache_clear()
+
+
+# project_id: contributors JSON
+contributors_cache = TTLCache(ttl=60)
+# project_id: (custom XLSForm bytes or None, form category, ETag or None)
+forms_cache = TTLCache(ttl=300)
+# url: (upstream ETag, flatgeobuf bytes), bounded by size as extracts can be large
+flatgeobuf_cache = TTLCache(ttl=86400, maxbytes=128 * 1024 * 1024)
+# task uuid: (status, message), only for finished background tasks
+finished_tasks_cache = TTLCache(ttl=3600)
+
+
+async def run_in_process_pool(func, *args, **kwargs):
+    """Run a CPU-bound function in a worker process, off the event loop.
+
+    The function and all arguments must be picklable.
+    """
+    loop = get_running_loop()
+    return await loop.run_in_executor(GEOM_POOL, partial(func, *args, **kwargs))
+
+
+@lru_cache(maxsize=64)
+def get_template_bytes(category: str) -> Optional[bytes]:
+    """Get the XLSForm template for a category, read once per process.
+
+    Templates are bundled with osm_fieldwork and only change on redeploy.
+    """
+    try:
+        return Path(f"{xlsforms_path}/{category}.xls").read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def get_project_filters(
     user_id: Optional[int] = None,
     hashtags: Optional[List[str]] = None,
     search: Optional[str] = None,
-):
-    """Get all projects."""
+    cursor: Optional[int] = None,
+) -> list:
+    """Build the WHERE clauses shared by project listings."""
     filters = []
+    if cursor:
+        filters.append(db_models.DbProject.id < cursor)
     if user_id:
         filters.append(db_models.DbProject.author_id == user_id)
 
     if hashtags:
-        filters.append(db_models.DbProject.hashtags.op("&&")(hashtags))  # type: ignore
+        # Array overlap, served by the idx_projects_hashtags GIN index
+        filters.append(db_models.DbProject.hashtags.overlap(hashtags))
 
     if search:
+        # ILIKE on the bare name column is served by idx_project_info_name_trgm
         filters.append(
             db_models.DbProject.project_info.has(
                 db_models.DbProjectInfo.name.ilike(f"%{search}%")
             )
         )
+    return filters
 
-    if len(filters) > 0:
-        db_projects = (
-            db.query(db_models.DbProject)
-            .filter(and_(*filters))
-            .order_by(db_models.DbProject.id.desc())  # type: ignore
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
-        project_count = db.query(db_models.DbProject).filter(and_(*filters)).count()
 
-    else:
-        db_projects = (
-            db.query(db_models.DbProject)
-            .order_by(db_models.DbProject.id.desc())  # type: ignore
-            .offset(skip)
-            .limit(limit)
-            .all()
+async def get_projects(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    user_id: Optional[int] = None,
+    hashtags: Optional[List[str]] = None,
+    search: Optional[str] = None,
+    cursor: Optional[int] = None,
+):
+    """Get all projects, newest first.
+
+    If cursor is given, only projects with a lower id are returned,
+    skip is ignored, and the count covers the remaining projects only.
+    """
+    filters = get_project_filters(user_id, hashtags, search, cursor)
+    if cursor:
+        skip = 0
+
+    # Count all matches alongside the page in the same query
+    # Related rows are loaded with one IN query per relationship, not per project
+    project_tasks = selectinload(db_models.DbProject.tasks)
+    rows = (
+        db.query(db_models.DbProject, func.count().over().label("total"))
+        .options(
+            selectinload(db_models.DbProject.author),
+            selectinload(db_models.DbProject.project_info),
+            project_tasks.selectinload(db_models.DbTask.lock_holder),
+            project_tasks.selectinload(db_models.DbTask.task_history),
         )
-        project_count = db.query(db_models.DbProject).count()
+        .filter(*filters)
+        .order_by(db_models.DbProject.id.desc())  # type: ignore
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+    db_projects = [row[0] for row in rows]
+    if rows:
+        project_count = rows[0].total
+    elif skip:
+        # Page is past the end, so the window count has no row to sit on
+        project_count = db.query(db_models.DbProject).filter(*filters).count()
+    else:
+        project_count = 0
+
     return project_count, await convert_to_app_projects(db_projects)
 
 
@@ -128,12 +246,106 @@ async def get_project_summaries(
     user_id: Optional[int] = None,
     hashtags: Optional[List[str]] = None,
     search: Optional[str] = None,
-):
-    """Get project summary details for main page."""
-    project_count, db_projects = await get_projects(
-        db, skip, limit, user_id, hashtags, search
+    cursor: Optional[int] = None,
+) -> tuple[int, list[project_schemas.ProjectSummary]]:
+    """Get project summary details for main page.
+
+    Selects only the summary columns, with task counts per status,
+    in a single query. The rows are trusted DB values, so the
+    summaries are built without re-validation.
+    """
+    filters = get_project_filters(user_id, hashtags, search, cursor)
+    if cursor:
+        skip = 0
+
+    page = (
+        select(db_models.DbProject.id, func.count().over().label("total"))
+        .where(*filters)
+        .order_by(db_models.DbProject.id.desc())
+        .offset(skip)
+        .limit(limit)
+        .subquery()
     )
-    return project_count, await convert_to_project_summaries(db_projects)
+
+    task = db_models.DbTask
+    task_counts = (
+        select(
+            func.count()
+            .filter(task.task_status == TaskStatus.MAPPED)
+            .label("tasks_mapped"),
+            func.count()
+            .filter(task.task_status == TaskStatus.VALIDATED)
+            .label("tasks_validated"),
+            func.count().filter(task.task_status == TaskStatus.BAD).label("tasks_bad"),
+        )
+        .where(task.project_id == db_models.DbProject.id)
+        .lateral("task_counts")
+    )
+
+    rows = db.execute(
+        select(
+            page.c.total,
+            db_models.DbProject.id,
+            db_models.DbProject.priority,
+            db_models.DbProjectInfo.name.label("title"),
+            func.ST_X(db_models.DbProject.centroid).label("x"),
+            func.ST_Y(db_models.DbProject.centroid).label("y"),
+            db_models.DbProject.location_str,
+            db_models.DbProjectInfo.short_description.label("description"),
+            db_models.DbProject.total_tasks,
+            task_counts.c.tasks_mapped,
+            task_counts.c.tasks_validated,
+            task_counts.c.tasks_bad,
+            db_models.DbProject.hashtags,
+            db_models.DbProject.organisation_id,
+            db_models.DbOrganisation.logo.label("organisation_logo"),
+        )
+        .select_from(db_models.DbProject)
+        .join(page, page.c.id == db_models.DbProject.id)
+        .join(task_counts, true())
+        .outerjoin(
+            db_models.DbProjectInfo,
+            db_models.DbProjectInfo.project_id == db_models.DbProject.id,
+        )
+        .outerjoin(
+            db_models.DbOrganisation,
+            db_models.DbOrganisation.id == db_models.DbProject.organisation_id,
+        )
+        .order_by(db_models.DbProject.id.desc())
+    ).all()
+
+    if rows:
+        project_count = rows[0].total
+    elif skip:
+        # Page is past the end, so the window count has no row to sit on
+        project_count = db.scalar(
+            select(func.count()).select_from(db_models.DbProject).where(*filters)
+        )
+    else:
+        project_count = 0
+
+    summaries = [
+        project_schemas.ProjectSummary.model_construct(
+            id=row.id,
+            priority=row.priority,
+            priority_str=row.priority.name,
+            title=row.title,
+            centroid=[row.x, row.y],
+            location_str=row.location_str,
+            description=row.description,
+            total_tasks=row.total_tasks,
+            tasks_mapped=row.tasks_mapped,
+            # TODO: get real number of contributors
+            num_contributors=row.tasks_mapped + row.tasks_validated,
+            tasks_validated=row.tasks_validated,
+            tasks_bad=row.tasks_bad,
+            hashtags=row.hashtags,
+            organisation_id=row.organisation_id,
+            organisation_logo=row.organisation_logo,
+        )
+        for row in rows
+    ]
+    return project_count, summaries
 
 
 async def get_project(db: Session, project_id: int):
@@ -151,16 +363,88 @@ async def get_project(db: Session, project_id: int):
     return db_project
 
 
-async def get_project_by_id(db: Session, project_id: int):
-    """Get a single project by id."""
-    db_project = (
-        db.query(db_models.DbProject)
-        .filter(db_models.DbProject.id == project_id)
-        .first()
-    )
+async def get_project_by_id(db: Session, project_id: int, load_tasks: bool = False):
+    """Get a single project by id.
+
+    Args:
+        db (Session): The database session.
+        project_id (int): The ID of the project.
+        load_tasks (bool): Eager load the tasks with their lock holder and
+            history, for callers that serialise them.
+    """
+    query = db.query(db_models.DbProject)
+    if load_tasks:
+        project_tasks = selectinload(db_models.DbProject.tasks)
+        query = query.options(
+            selectinload(db_models.DbProject.author),
+            selectinload(db_models.DbProject.project_info),
+            project_tasks.selectinload(db_models.DbTask.lock_holder),
+            project_tasks.selectinload(db_models.DbTask.task_history),
+        )
+    db_project = query.filter(db_models.DbProject.id == project_id).first()
     return await convert_to_app_project(db_project)
 
 
+def get_project_form(
+    db: Session, project_id: int
+) -> tuple[Optional[bytes], str, Optional[str]]:
+    """Get the custom XLSForm and form category for a project.
+
+    Cached for a few minutes, as the form blob is only replaced via
+    update_project_form_xls, which invalidates the entry.
+
+    Returns:
+        tuple: The custom XLSForm bytes (or None), the form category,
+            and an ETag for the custom form (or None).
+    """
+    if cached := forms_cache.get(project_id):
+        return cached
+
+    form = db.execute(
+        select(db_models.DbProject.form_xls, db_models.DbProject.xform_category).where(
+            db_models.DbProject.id == project_id
+        )
+    ).first()
+    if not form:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail=f"Project with id {project_id} does not exist",
+        )
+
+    form_xls, xform_category = form
+    etag = f'"{sha256(form_xls).hexdigest()}"' if form_xls else None
+    forms_cache.set(project_id, (form_xls, xform_category, etag))
+    return form_xls, xform_category, etag
+
+
+def update_project_form_xls(db: Session, project_id: int, form_xls: bytes) -> bool:
+    """Store a custom XLSForm for a project, unless it is unchanged.
+
+    Only the digest of the stored form is fetched for comparison, so
+    re-uploading the same file sends no blob and writes no new row
+    version. The caller must commit.
+
+    Returns:
+        bool: True if the form was updated.
+    """
+    stored_digest = db.execute(
+        text("SELECT sha256(form_xls) FROM projects WHERE id = :project_id;"),
+        {"project_id": project_id},
+    ).scalar()
+    if stored_digest is not None and bytes(stored_digest) == sha256(form_xls).digest():
+        log.debug(f"XLSForm unchanged for project {project_id}, skipping update")
+        return False
+
+    db.execute(
+        update(db_models.DbProject)
+        .where(db_models.DbProject.id == project_id)
+        .values(form_xls=form_xls)
+        .execution_options(synchronize_session=False)
+    )
+    forms_cache.invalidate(project_id)
+    return True
+
+
 async def get_project_info_by_id(db: Session, project_id: int):
     """Get the project info only by id."""
     db_project_info = (
@@ -184,6 +468,25 @@ async def delete_one_project(db: Session, db_project: db_models.DbProject) -> No
         raise HTTPException(e) from e
 
 
+def commit_project_name(db: Session, project_name: str) -> None:
+    """Commit a project insert or update that may set its name.
+
+    Raises:
+        HTTPException: 400 if another project already has the name,
+            ignoring case (enforced by idx_project_info_name_lower).
+    """
+    try:
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if "idx_project_info_name_lower" not in str(e.orig):
+            raise
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail=f"Project already exists with the name {project_name}",
+        ) from e
+
+
 async def partial_update_project_info(
     db: Session,
     project_metadata: project_schemas.ProjectPartialUpdate,
@@ -209,7 +512,7 @@ async def partial_update_project_info(
         if project_metadata.hashtags:
             db_project.hashtags = project_metadata.hashtags
 
-    db.commit()
+    commit_project_name(db, project_metadata.name)
     db.refresh(db_project)
 
     return await convert_to_app_project(db_project)
@@ -246,7 +549,7 @@ async def update_project_info(
         db_project_info.short_description = project_info.short_description
         db_project_info.description = project_info.description
 
-    db.commit()
+    commit_project_name(db, project_info.name)
     db.refresh(db_project)
 
     return await convert_to_app_project(db_project)
@@ -298,12 +601,40 @@ async def create_project_with_project_info(
     )
     db.add(db_project_info)
 
-    db.commit()
+    commit_project_name(db, project_name)
     db.refresh(db_project)
 
     return await convert_to_app_project(db_project)
 
 
+async def update_project_location(project_id: int):
+    """Geocode the centroid of a project and store it as location_str.
+
+    Run as a background task after project creation,
+    so the request does not wait on the geocoding service.
+    """
+    db = SessionLocal()
+    try:
+        centroid = db.execute(
+            select(
+                func.ST_X(db_models.DbProject.centroid),
+                func.ST_Y(db_models.DbProject.centroid),
+            ).where(db_models.DbProject.id == project_id)
+        ).first()
+        if not centroid or centroid[0] is None:
+            return
+        longitude, latitude = centroid
+        address = await get_address_from_lat_lon_async(latitude, longitude)
+        db.execute(
+            update(db_models.DbProject)
+            .where(db_models.DbProject.id == project_id)
+            .values(location_str=address if address is not None else "")
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
 async def create_tasks_from_geojson(
     db: Session,
     project_id: int,
@@ -320,7 +651,8 @@ async def create_tasks_from_geojson(
         else:
             polygons = boundaries["features"]
         log.debug(f"Processing {len(polygons)} task geometries")
-        for index, polygon in enumerate(polygons):
+        geometries = []
+        for polygon in polygons:
             # If the polygon is a MultiPolygon, convert it to a Polygon
             if polygon["geometry"]["type"] == "MultiPolygon":
                 log.debug("Converting MultiPolygon to Polygon")
@@ -328,18 +660,21 @@ async def create_tasks_from_geojson(
                 polygon["geometry"]["coordinates"] = polygon["geometry"]["coordinates"][
                     0
                 ]
-
-            db_task = db_models.DbTask(
-                project_id=project_id,
-                outline=wkblib.dumps(shape(polygon["geometry"]), hex=True),
-                project_task_index=index,
-            )
-            db.add(db_task)
-            log.debug(
-                "Created database task | "
-                f"Project ID {project_id} | "
-                f"Task index {index}"
-            )
+            geometries.append(polygon["geometry"])
+
+        # Single multi-row INSERT, rather than flushing one ORM object per task
+        db.execute(
+            insert(db_models.DbTask),
+            [
+                {
+                    "project_id": project_id,
+                    "outline": outline,
+                    "project_task_index": index,
+                }
+                for index, outline in enumerate(geojson_to_wkb_hex(geometries))
+            ],
+        )
+        log.debug(f"Created {len(geometries)} database tasks | Project ID {project_id}")
 
         # Commit all tasks and update project location in db
         db.commit()
@@ -397,12 +732,7 @@ async def preview_split_by_square(boundary: str, meters: int):
         for feature in features:
             feature["geometry"] = geometry
         boundary["features"] = features
-    return await run_in_threadpool(
-        lambda: split_by_square(
-            boundary,
-            meters=meters,
-        )
-    )
+    return await run_in_process_pool(split_by_square, boundary, meters=meters)
 
 
 async def generate_data_extract(
@@ -433,21 +763,26 @@ async def generate_data_extract(
             detail="To generate a new data extract a form_category must be specified.",
         )
 
-    pg = PostgresClient(
-        "underpass",
-        extract_config,
-        # auth_token=settings.OSM_SVC_ACCOUNT_TOKEN,
-    )
-    fgb_url = pg.execQuery(
-        aoi,
-        extra_params={
-            "fileName": "fmtm_extract",
-            "outputType": "fgb",
-            "bind_zip": False,
-            "useStWithin": False,
-            "fgb_wrap_geoms": True,
-        },
-    )
+    def request_extract():
+        """Request the extract and poll raw-data-api until it is ready."""
+        pg = PostgresClient(
+            "underpass",
+            extract_config,
+            # auth_token=settings.OSM_SVC_ACCOUNT_TOKEN,
+        )
+        return pg.execQuery(
+            aoi,
+            extra_params={
+                "fileName": "fmtm_extract",
+                "outputType": "fgb",
+                "bind_zip": False,
+                "useStWithin": False,
+                "fgb_wrap_geoms": True,
+            },
+        )
+
+    # Blocking HTTP requests, so keep them off the event loop
+    fgb_url = await run_in_threadpool(request_extract)
 
     if not fgb_url:
         msg = "Could not get download URL for data extract. Did the API change?"
@@ -461,15 +796,15 @@ async def generate_data_extract(
 
 
 async def split_geojson_into_tasks(
-    db: Session,
     project_geojson: Union[dict, FeatureCollection],
     no_of_buildings: int,
     extract_geojson: Optional[FeatureCollection] = None,
 ):
     """Splits a project into tasks.
 
+    The splitting runs in a worker process, with its own db connection.
+
     Args:
-        db (Session): A database session.
         project_geojson (Union[dict, FeatureCollection]): A GeoJSON of the project
             boundary.
         extract_geojson (Union[dict, FeatureCollection]): A GeoJSON of the project
@@ -483,13 +818,12 @@ async def split_geojson_into_tasks(
         Any: A GeoJSON object containing the tasks for the specified project.
     """
     log.debug("STARTED task splitting using provided boundary and data extract")
-    features = await run_in_threadpool(
-        lambda: split_by_sql(
-            project_geojson,
-            db,
-            num_buildings=no_of_buildings,
-            osm_extract=extract_geojson,
-        )
+    features = await run_in_process_pool(
+        split_by_sql,
+        project_geojson,
+        settings.FMTM_DB_URL.unicode_string(),
+        num_buildings=no_of_buildings,
+        osm_extract=extract_geojson,
     )
     log.debug("COMPLETE task splitting")
     return features
@@ -565,10 +899,11 @@ async def update_project_boundary(
         boundary,
         meters=meters,
     )
-    for index, poly in enumerate(tasks["features"]):
+    outlines = geojson_to_wkb_hex([poly["geometry"] for poly in tasks["features"]])
+    for index, outline in enumerate(outlines):
         db_task = db_models.DbTask(
             project_id=project_id,
-            outline=wkblib.dumps(shape(poly["geometry"]), hex=True),
+            outline=outline,
             # qr_code=db_qr,
             # qr_code_id=db_qr.id,
             # project_task_index=feature["properties"]["fid"],
@@ -1115,9 +1450,7 @@ def generate_task_files(
         return False
 
     # Create memory object from split data extract
-    geojson_string = geojson.dumps(data_extract)
-    geojson_bytes = geojson_string.encode("utf-8")
-    geojson_data = BytesIO(geojson_bytes)
+    geojson_data = BytesIO(to_json(data_extract))
 
     project_log.info(f"Generating xform from for task: ({task_id})")
 
@@ -1163,8 +1496,7 @@ def generate_task_files(
     # NOTE ODK Central creation complete, update task in database
 
     # Get task entry from db
-    get_task_sync = async_to_sync(tasks_crud.get_task)
-    task = get_task_sync(db, task_id)
+    task = tasks_crud.get_task(db, task_id)
 
     # Add odk_token to task
     odk_url = odk_credentials.odk_central_url
@@ -1226,9 +1558,12 @@ def generate_project_files(
         else:
             log.debug(f"Using default XLSForm for category: '{form_category}'")
 
-            xlsform_path = f"{xlsforms_path}/{form_category}.xls"
-            with open(xlsform_path, "rb") as f:
-                xlsform = BytesIO(f.read())
+            if (template := get_template_bytes(form_category)) is None:
+                raise HTTPException(
+                    status_code=HTTPStatus.NOT_FOUND,
+                    detail=f"No XLSForm template for category {form_category}",
+                )
+            xlsform = BytesIO(template)
 
             # NOTE would filtering be required at any point if this
             # NOTE is handled upstream?
@@ -1320,28 +1655,83 @@ def generate_project_files(
             raise e
 
 
-async def get_project_geometry(db: Session, project_id: int):
+def generate_project_files_with_session(
+    project_id: int,
+    custom_form: Optional[bytes],
+    form_category: str,
+    form_file_ext: str,
+    background_task_id: Optional[uuid.UUID] = None,
+):
+    """Run generate_project_files with a db session of its own.
+
+    For use in a worker process, where the request session is not available.
+    """
+    db = SessionLocal()
+    try:
+        generate_project_files(
+            db,
+            project_id,
+            BytesIO(custom_form) if custom_form else None,
+            form_category,
+            form_file_ext,
+            background_task_id,
+        )
+    finally:
+        db.close()
+
+
+async def generate_project_files_in_worker(
+    project_id: int,
+    custom_form: Optional[bytes],
+    form_category: str,
+    form_file_ext: str,
+    background_task_id: uuid.UUID,
+):
+    """Generate the files for a project in the project files pool.
+
+    Keeps the form conversion and ODK Central calls out of the web worker.
+    Progress and errors are recorded against the background task in the db.
+    """
+    loop = get_running_loop()
+    await loop.run_in_executor(
+        project_files_pool(),
+        partial(
+            generate_project_files_with_session,
+            project_id,
+            custom_form,
+            form_category,
+            form_file_ext,
+            background_task_id,
+        ),
+    )
+
+
+async def get_project_geometry(db: Session, project_id: int, precision: int = 6):
     """Retrieves the geometry of a project.
 
     Args:
         db (Session): The database session.
         project_id (int): The ID of the project.
+        precision (int): Max decimal places in the coordinates.
+            6 is ~10cm, the PostGIS default of 9 bloats the payload.
 
     Returns:
         str: A geojson of the project outline.
     """
-    projects = table("projects", column("outline"), column("id"))
-    where = f"projects.id={project_id}"
-    sql = select(geoalchemy2.functions.ST_AsGeoJSON(projects.c.outline)).where(
-        text(where)
+    sql = text(
+        """
+        SELECT ST_AsGeoJSON(outline, :precision)
+        FROM projects
+        WHERE id = :project_id;
+        """
     )
-    result = db.execute(sql)
-    # There should only be one match
-    if result.rowcount != 1:
-        log.warning(str(sql))
+    outline = db.execute(
+        sql, {"project_id": project_id, "precision": precision}
+    ).scalar()
+    if not outline:
+        log.warning(f"No outline found for project ({project_id})")
         return False
-    row = eval(result.first()[0])
-    return json.dumps(row)
+    return outline
 
 
 async def get_task_geometry(db: Session, project_id: int):
@@ -1354,34 +1744,155 @@ async def get_task_geometry(db: Session, project_id: int):
     Returns:
         str: A geojson of the task boundaries
     """
-    db_tasks = await tasks_crud.get_tasks(db, project_id, None)
-    features = []
-    for task in db_tasks:
-        geom = to_shape(task.outline)
-        # Convert the shapely geometry object to GeoJSON
-        geometry = geom.__geo_interface__
-        properties = {
-            "task_id": task.id,
-        }
-        feature = {"type": "Feature", "geometry": geometry, "properties": properties}
-        features.append(feature)
+    sql = text(
+        """
+        SELECT jsonb_build_object(
+            'type', 'FeatureCollection',
+            'features', COALESCE(jsonb_agg(
+                jsonb_build_object(
+                    'type', 'Feature',
+                    'geometry', ST_AsGeoJSON(outline)::jsonb,
+                    'properties', jsonb_build_object('task_id', id)
+                )
+            ), '[]'::jsonb)
+        )::text
+        FROM tasks
+        WHERE project_id = :project_id;
+        """
+    )
+    return db.execute(sql, {"project_id": project_id}).scalar()
 
-    feature_collection = {"type": "FeatureCollection", "features": features}
-    return json.dumps(feature_collection)
 
+async def get_task_geometry_stream(
+    db: Session, project_id: int, precision: int = 6, batch_size: int = 500
+) -> Iterator[bytes]:
+    """Retrieves the task boundaries for a project, as streamed chunks.
 
-async def get_project_features_geojson(
-    db: Session,
-    project: Union[db_models.DbProject, int],
-    task_id: Optional[int] = None,
-) -> FeatureCollection:
-    """Get a geojson of all features for a task."""
-    if isinstance(project, int):
-        db_project = await get_project(db, project)
-    else:
-        db_project = project
-    project_id = db_project.id
+    Each task feature is serialised by PostGIS and fetched from a
+    server-side cursor, so the FeatureCollection is never built in memory.
+
+    Args:
+        db (Session): The database session.
+        project_id (int): The ID of the project.
+        precision (int): Max decimal places in the coordinates.
+        batch_size (int): Number of features fetched per round trip.
+
+    Returns:
+        Iterator[bytes]: Chunks of a GeoJSON FeatureCollection.
+    """
+    sql = text(
+        """
+        SELECT jsonb_build_object(
+            'type', 'Feature',
+            'geometry', ST_AsGeoJSON(outline, :precision)::jsonb,
+            'properties', jsonb_build_object('task_id', id)
+        )::text
+        FROM tasks
+        WHERE project_id = :project_id;
+        """
+    ).execution_options(yield_per=batch_size)
+    result = db.execute(sql, {"project_id": project_id, "precision": precision})
+
+    def generate_chunks() -> Iterator[bytes]:
+        yield b'{"type":"FeatureCollection","features":['
+        separator = b""
+        for rows in result.partitions():
+            yield separator + b",".join(row[0].encode() for row in rows)
+            separator = b","
+        yield b"]}"
+
+    return generate_chunks()
+
+
+async def get_task_vector_tile(
+    db: Session, project_id: int, z: int, x: int, y: int
+) -> bytes:
+    """Get a Mapbox Vector Tile of the task boundaries for a project.
+
+    Only tasks intersecting the tile are read, via the idx_tasks_outline
+    GiST index, so the tile size does not grow with the project size.
+
+    Args:
+        db (Session): The database session.
+        project_id (int): The ID of the project.
+        z (int): Tile zoom level.
+        x (int): Tile column.
+        y (int): Tile row.
+
+    Returns:
+        bytes: The MVT encoded tile, empty if no tasks intersect it.
+    """
+    sql = text(
+        """
+        WITH bounds AS (
+            SELECT ST_TileEnvelope(:z, :x, :y) AS geom
+        ),
+        mvt_geoms AS (
+            SELECT
+                ST_AsMVTGeom(
+                    ST_Transform(tasks.outline, 3857), bounds.geom
+                ) AS geom,
+                tasks.id AS task_id,
+                tasks.project_task_index,
+                tasks.task_status::text AS task_status
+            FROM tasks, bounds
+            WHERE tasks.project_id = :project_id
+            AND tasks.outline && ST_Transform(bounds.geom, 4326)
+        )
+        SELECT ST_AsMVT(mvt_geoms, 'tasks') FROM mvt_geoms;
+        """
+    )
+    tile = db.execute(sql, {"project_id": project_id, "z": z, "x": x, "y": y}).scalar()
+    return bytes(tile) if tile else b""
 
+
+def fetch_flatgeobuf(
+    url: str, max_size: int = 512 * 1024 * 1024, chunk_size: int = 64 * 1024
+) -> Optional[bytes]:
+    """Download a flatgeobuf by URL, revalidating any cached copy.
+
+    Files served with an ETag are cached, and later fetches send
+    If-None-Match, so an unchanged file is not transferred again.
+    The body is streamed in chunks and the download aborted once it
+    passes max_size, as the URL may be user provided.
+    requests is blocking, so call from the threadpool.
+
+    Args:
+        url (str): URL to the flatgeobuf file.
+        max_size (int): Largest file accepted, in bytes.
+        chunk_size (int): Bytes read from the socket at a time.
+
+    Returns:
+        bytes: The flatgeobuf file, or None if the download failed.
+    """
+    cached = flatgeobuf_cache.get(url)
+    headers = {"If-None-Match": cached[0]} if cached else {}
+
+    with http_session().get(url, headers=headers, stream=True) as response:
+        if cached and response.status_code == HTTPStatus.NOT_MODIFIED:
+            return cached[1]
+        if not response.ok:
+            return None
+        if int(response.headers.get("Content-Length", 0)) > max_size:
+            log.warning(f"Flatgeobuf larger than {max_size} bytes: {url}")
+            return None
+
+        buffer = bytearray()
+        for chunk in response.iter_content(chunk_size):
+            buffer += chunk
+            if len(buffer) > max_size:
+                log.warning(f"Flatgeobuf larger than {max_size} bytes: {url}")
+                return None
+        flatgeobuf = bytes(buffer)
+
+        if etag := response.headers.get("ETag"):
+            flatgeobuf_cache.set(url, (etag, flatgeobuf), nbytes=len(flatgeobuf))
+        return flatgeobuf
+
+
+async def get_project_data_extract(db_project: db_models.DbProject) -> bytes:
+    """Download the flatgeobuf data extract for a project from S3."""
+    project_id = db_project.id
     data_extract_url = db_project.data_extract_url
 
     if not data_extract_url:
@@ -1396,13 +1907,63 @@ async def get_project_features_geojson(
         settings.S3_ENDPOINT,
     )
 
-    with requests.get(data_extract_url) as response:
-        if not response.ok:
-            raise HTTPException(
-                status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
-                detail=f"Download failed for data extract, project ({project_id})",
-            )
-        data_extract_geojson = await flatgeobuf_to_geojson(db, response.content)
+    # NOTE download in the threadpool, as requests blocks the event loop
+    data_extract = await run_in_threadpool(fetch_flatgeobuf, data_extract_url)
+    if not data_extract:
+        raise HTTPException(
+            status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+            detail=f"Download failed for data extract, project ({project_id})",
+        )
+    return data_extract
+
+
+async def get_project_features_geojson_stream(
+    db: Session, project_id: int
+) -> Iterator[bytes]:
+    """Get a geojson of all features for a project, as streamed chunks."""
+    db_project = await get_project(db, project_id)
+    data_extract = await get_project_data_extract(db_project)
+
+    chunks = await flatgeobuf_to_geojson_stream(db, data_extract)
+    if not chunks:
+        raise HTTPException(
+            status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+            detail=(
+                "Failed to convert flatgeobuf --> geojson for "
+                f"project ({project_id})"
+            ),
+        )
+    return chunks
+
+
+async def get_task_features_geojson(db: Session, project_id: int, task_id: int) -> str:
+    """Get a geojson of the features within a task area, as JSON text."""
+    db_project = await get_project(db, project_id)
+    data_extract = await get_project_data_extract(db_project)
+
+    featcol = await flatgeobuf_to_task_geojson(db, data_extract, project_id, task_id)
+    if not featcol:
+        raise HTTPException(
+            status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+            detail=(f"Failed to extract geojson for task ({task_id})"),
+        )
+    return featcol
+
+
+async def get_project_features_geojson(
+    db: Session,
+    project: Union[db_models.DbProject, int],
+    task_id: Optional[int] = None,
+) -> FeatureCollection:
+    """Get a geojson of all features for a task."""
+    if isinstance(project, int):
+        db_project = await get_project(db, project)
+    else:
+        db_project = project
+    project_id = db_project.id
+
+    data_extract = await get_project_data_extract(db_project)
+    data_extract_geojson = await flatgeobuf_to_geojson(db, data_extract)
 
     if not data_extract_geojson:
         raise HTTPException(
@@ -1536,61 +2097,83 @@ async def convert_to_app_projects(
         return []
 
 
-async def convert_to_project_summary(db_project: db_models.DbProject):
-    """Legacy function to convert db models --> Pydantic.
-
-    TODO refactor to use Pydantic model methods instead.
-    """
-    if db_project:
-        summary: project_schemas.ProjectSummary = db_project
-
-        if db_project.project_info:
-            summary.location_str = db_project.location_str
-            summary.title = db_project.project_info.name
-            summary.description = db_project.project_info.short_description
-
-        summary.num_contributors = (
-            db_project.tasks_mapped + db_project.tasks_validated
-        )  # TODO: get real number of contributors
-        summary.organisation_logo = (
-            db_project.organisation.logo if db_project.organisation else None
-        )
-
-        return summary
-    else:
-        return None
+def get_project_logs(
+    project_id: int,
+    limit: int = 50,
+    log_file: Path = Path("/opt/logs/create_project.json"),
+    chunk_size: int = 64 * 1024,
+) -> list[str]:
+    """Get the last log messages for a project from the JSON log file.
 
+    The file is read backwards in chunks, stopping once enough messages
+    are found, so the cost does not grow with the size of the log.
 
-async def convert_to_project_summaries(
-    db_projects: List[db_models.DbProject],
-) -> List[project_schemas.ProjectSummary]:
-    """Legacy function to convert db models --> Pydantic.
+    Args:
+        project_id (int): The project to get log messages for.
+        limit (int): The maximum number of messages to return.
+        log_file (Path): The loguru JSON (serialized) log file.
+        chunk_size (int): Bytes to read from the file at a time.
 
-    TODO refactor to use Pydantic model methods instead.
+    Returns:
+        list[str]: Log messages, oldest first.
     """
-    if db_projects and len(db_projects) > 0:
+    messages = []
 
-        async def convert_summary(project):
-            return await convert_to_project_summary(project)
+    def add_line(line: bytes) -> None:
+        if b'"project_id"' not in line:
+            return
+        try:
+            record = from_json(line).get("record", {})
+        except ValueError:
+            # Line still being written, or not JSON
+            return
+        if record.get("extra", {}).get("project_id") == project_id:
+            messages.append(record.get("message"))
 
-        project_summaries = await gather(
-            *[convert_summary(project) for project in db_projects]
-        )
-        return [summary for summary in project_summaries if summary is not None]
-    else:
-        return []
+    try:
+        log_fd = open(log_file, "rb")
+    except FileNotFoundError:
+        return messages
+
+    with log_fd:
+        position = log_fd.seek(0, os.SEEK_END)
+        partial_line = b""
+        while position > 0 and len(messages) < limit:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            log_fd.seek(position)
+            lines = (log_fd.read(read_size) + partial_line).split(b"\n")
+            # The first line may continue in the previous chunk
+            partial_line = lines.pop(0)
+            for line in reversed(lines):
+                add_line(line)
+        if position == 0 and len(messages) < limit:
+            add_line(partial_line)
+
+    return messages[:limit][::-1]
 
 
 async def get_background_task_status(task_id: uuid.UUID, db: Session):
-    """Get the status of a background task."""
-    task = (
-        db.query(db_models.BackgroundTasks)
-        .filter(db_models.BackgroundTasks.id == str(task_id))
-        .first()
-    )
+    """Get the status of a background task.
+
+    Clients poll this until the task finishes, and often after.
+    Finished tasks never change again, so their status is cached.
+    """
+    if cached := finished_tasks_cache.get(str(task_id)):
+        return cached
+
+    task = db.execute(
+        select(
+            db_models.BackgroundTasks.status,
+            db_models.BackgroundTasks.message,
+        ).where(db_models.BackgroundTasks.id == str(task_id))
+    ).first()
     if not task:
         log.warning(f"No background task with found with UUID: {task_id}")
         raise HTTPException(status_code=404, detail="Task not found")
+
+    if task.status in (BackgroundTaskStatus.SUCCESS, BackgroundTaskStatus.FAILED):
+        finished_tasks_cache.set(str(task_id), (task.status, task.message))
     return task.status, task.message
 
 
@@ -1696,7 +2279,7 @@ async def update_background_task_status_in_database(
 #     )
 #     # TODO upload data extract to S3 bucket
 
-#     tasks_list = await tasks_crud.get_task_id_list(db, project_id)
+#     tasks_list = tasks_crud.get_task_id_list(db, project_id)
 
 #     for task_id in tasks_list:
 #         # This file will store xml contents of an xls form.
@@ -1748,7 +2331,6 @@ async def get_extracted_data_from_db(db: Session, project_id: int, outfile: str)
         geojson.dump(features, jsonfile)
 
 
-# NOTE defined as non-async to run in separate thread
 def get_project_tiles(
     db: Session,
     project_id: int,
@@ -1759,6 +2341,11 @@ def get_project_tiles(
 ):
     """Get the tiles for a project.
 
+    Synchronous, so BackgroundTasks runs the DB work in the threadpool
+    rather than on the event loop. The basemap itself is created in a
+    TILES_POOL worker process, so long running tile downloads do not hold
+    up the web worker.
+
     Args:
         db (Session): SQLAlchemy db session.
         project_id (int): ID of project to create tiles for.
@@ -1788,15 +2375,15 @@ def get_project_tiles(
         # Project Outline
         log.debug(f"Getting bbox for project: {project_id}")
         query = text(
-            f"""SELECT ST_XMin(ST_Envelope(outline)) AS min_lon,
+            """SELECT ST_XMin(ST_Envelope(outline)) AS min_lon,
                         ST_YMin(ST_Envelope(outline)) AS min_lat,
                         ST_XMax(ST_Envelope(outline)) AS max_lon,
                         ST_YMax(ST_Envelope(outline)) AS max_lat
                 FROM projects
-                WHERE id = {project_id};"""
+                WHERE id = :project_id;"""
         )
 
-        result = db.execute(query)
+        result = db.execute(query, {"project_id": project_id})
         project_bbox = result.fetchone()
         log.debug(f"Extracted project bbox: {project_bbox}")
 
@@ -1815,7 +2402,9 @@ def get_project_tiles(
             f"xy={False} | "
             f"tms={tms}"
         )
-        create_basemap_file(
+        # Block this threadpool thread until the worker process finishes
+        TILES_POOL.submit(
+            create_basemap_file,
             boundary=f"{min_lon},{min_lat},{max_lon},{max_lat}",
             outfile=outfile,
             zooms=zooms,
@@ -1823,7 +2412,7 @@ def get_project_tiles(
             source=source,
             xy=False,
             tms=tms,
-        )
+        ).result()
         log.info(f"Basemap created for project ID {project_id}: {outfile}")
 
         tile_path_instance.status = 4
@@ -1847,40 +2436,55 @@ def get_project_tiles(
         update_bg_task_sync(db, background_task_id, 2, str(e))  # 2 is FAILED
 
 
-async def get_mbtiles_list(db: Session, project_id: int):
-    """List mbtiles in database for a project."""
-    try:
-        tiles_list = (
-            db.query(
-                db_models.DbTilesPath.id,
-                db_models.DbTilesPath.project_id,
-                db_models.DbTilesPath.status,
-                db_models.DbTilesPath.tile_source,
-            )
-            .filter(db_models.DbTilesPath.project_id == str(project_id))
-            .all()
-        )
+async def get_mbtiles_list(
+    db: Session, project_id: int, limit: int = 50, before_id: Optional[int] = None
+):
+    """List mbtiles in database for a project, newest first.
 
-        processed_tiles_list = [
-            {
-                "id": x.id,
-                "project_id": x.project_id,
-                "status": x.status.name,
-                "tile_source": x.tile_source,
-            }
-            for x in tiles_list
-        ]
+    Pages with a keyset on id, so each page is a single index range scan.
 
-        return processed_tiles_list
+    Args:
+        db (Session): SQLAlchemy database session.
+        project_id (int): The project ID.
+        limit (int): Maximum number of tile archives to return.
+        before_id (int, optional): Only return archives older than this id,
+            i.e. the id of the last item from the previous page.
 
-    except Exception as e:
-        log.exception(e)
-        raise HTTPException(status_code=400, detail=str(e)) from e
+    Returns:
+        list[dict]: Tile archive id, project_id, status and tile_source.
+    """
+    query = text(
+        """
+        SELECT id, project_id, status, tile_source
+        FROM mbtiles_path
+        WHERE project_id = :project_id
+            AND (CAST(:before_id AS integer) IS NULL OR id < :before_id)
+        ORDER BY id DESC
+        LIMIT :limit;
+    """
+    )
+    result = db.execute(
+        query, {"project_id": project_id, "before_id": before_id, "limit": limit}
+    )
+    return [dict(row) for row in result.mappings()]
 
 
-async def convert_geojson_to_osm(geojson_file: str):
-    """Convert a GeoJSON file to OSM format."""
-    return json2osm(geojson_file)
+def convert_geojson_to_osm(geojson_str: str) -> str:
+    """Convert a GeoJSON string to OSM XML.
+
+    json2osm only works with files, so the input is written to a uniquely
+    named temporary file, which is removed along with the output afterwards.
+    Safe to run concurrently.
+    """
+    with TemporaryDirectory() as tmpdir:
+        # Unique stem, in case json2osm writes the output to the working dir
+        geojson_file = Path(tmpdir) / f"{Path(tmpdir).name}.geojson"
+        geojson_file.write_text(geojson_str)
+        osm_file = Path(json2osm(str(geojson_file)))
+        try:
+            return osm_file.read_text()
+        finally:
+            osm_file.unlink(missing_ok=True)
 
 
 async def get_pagination(page: int, count: int, results_per_page: int, total: int):
@@ -1928,79 +2532,65 @@ async def get_dashboard_detail(
         project.total_submission = 0
         pass
 
-    contributors = (
-        db.query(db_models.DbTaskHistory.user_id)
-        .filter(
-            db_models.DbTaskHistory.project_id == project.id,
-            db_models.DbTaskHistory.user_id.isnot(None),
-        )
-        .distinct()
-        .count()
+    counts_sql = text(
+        """
+        SELECT
+            (SELECT COUNT(*) FROM tasks WHERE project_id = :project_id)
+                AS total_tasks,
+            (SELECT COUNT(DISTINCT user_id) FROM task_history
+                WHERE project_id = :project_id) AS total_contributors;
+        """
     )
+    counts = db.execute(counts_sql, {"project_id": project.id}).one()
 
-    project.total_tasks = await tasks_crud.get_task_count_in_project(db, project.id)
+    project.total_tasks = counts.total_tasks
     project.organisation_name, project.organisation_logo = (
         db_organisation.name,
         db_organisation.logo,
     )
-    project.total_contributors = contributors
+    project.total_contributors = counts.total_contributors
 
     return project
 
 
-async def get_project_users(db: Session, project_id: int):
+def get_project_users(db: Session, project_id: int) -> str:
     """Get the users and their contributions for a project.
 
-    Args:
-        db (Session): The database session.
-        project_id (int): The ID of the project.
-
-    Returns:
-        List[Dict[str, Union[str, int]]]: A list of dictionaries containing
-            the username and the number of contributions made by each user
-            for the specified project.
-    """
-    contributors = (
-        db.query(db_models.DbTaskHistory)
-        .filter(db_models.DbTaskHistory.project_id == project_id)
-        .all()
-    )
-    unique_user_ids = {
-        user.user_id for user in contributors if user.user_id is not None
-    }
-    response = []
-
-    for user_id in unique_user_ids:
-        contributions = count_user_contributions(db, user_id, project_id)
-        db_user = await user_crud.get_user(db, user_id)
-        response.append({"user": db_user.username, "contributions": contributions})
-
-    response = sorted(response, key=lambda x: x["contributions"], reverse=True)
-    return response
-
-
-def count_user_contributions(db: Session, user_id: int, project_id: int) -> int:
-    """Count contributions for a specific user.
+    The JSON is built by the database and cached for a minute per project,
+    as contributions only change when tasks are mapped or validated.
 
     Args:
         db (Session): The database session.
-        user_id (int): The ID of the user.
         project_id (int): The ID of the project.
 
     Returns:
-        int: The number of contributions made by the user for the specified
-            project.
+        str: A JSON list of objects containing the username and the number
+            of contributions made by each user for the specified project.
     """
-    contributions_count = (
-        db.query(func.count(db_models.DbTaskHistory.user_id))
-        .filter(
-            db_models.DbTaskHistory.user_id == user_id,
-            db_models.DbTaskHistory.project_id == project_id,
-        )
-        .scalar()
+    if cached := contributors_cache.get(project_id):
+        return cached
+
+    sql = text(
+        """
+        SELECT COALESCE(
+            jsonb_agg(
+                jsonb_build_object('user', username, 'contributions', contributions)
+                ORDER BY contributions DESC
+            ),
+            '[]'::jsonb
+        )::text
+        FROM (
+            SELECT users.username, COUNT(*) AS contributions
+            FROM task_history
+            JOIN users ON users.id = task_history.user_id
+            WHERE task_history.project_id = :project_id
+            GROUP BY users.id, users.username
+        ) AS project_users;
+        """
     )
-
-    return contributions_count
+    contributors = db.execute(sql, {"project_id": project_id}).scalar()
+    contributors_cache.set(project_id, contributors)
+    return contributors
 
 
 async def add_project_admin(
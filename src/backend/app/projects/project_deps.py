@@ -18,19 +18,30 @@
 
 """Project dependencies for use in Depends."""
 
+from pathlib import Path
 from typing import Optional
 
-from fastapi import Depends
+from fastapi import Depends, File, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.exceptions import HTTPException
 from loguru import logger as log
+from pydantic_core import from_json
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.cache import TTLCache
 from app.db.database import get_db
 from app.db.db_models import DbProject
 from app.models.enums import HTTPStatus
 from app.projects import project_schemas
 
+GEOJSON_EXTS = frozenset({".geojson", ".json"})
+EXTRACT_EXTS = frozenset({".geojson", ".json", ".fgb"})
+XLSFORM_EXTS = frozenset({".xls", ".xlsx", ".xml"})
+
+# project_id: decrypted credentials
+odk_creds_cache = TTLCache(ttl=300)
+
 
 async def get_project_by_id(
     db: Session = Depends(get_db), project_id: Optional[int] = None
@@ -51,7 +62,15 @@ async def get_project_by_id(
 
 
 async def get_odk_credentials(db: Session, project_id: int):
-    """Get ODK credentials of a project, or default organization credentials."""
+    """Get ODK credentials of a project, or default organization credentials.
+
+    Results are cached per project for 5 minutes, avoiding the
+    query and password decryption on repeat calls.
+    Call invalidate_odk_credentials after changing project or org credentials.
+    """
+    if cached := odk_creds_cache.get(project_id):
+        return cached
+
     sql = text(
         """
     SELECT
@@ -84,8 +103,113 @@ async def get_odk_credentials(db: Session, project_id: int):
 
     log.debug(f"Retrieved ODK creds for project ({project_id}): {url} | {user}")
 
-    return project_schemas.ODKCentralDecrypted(
+    odk_credentials = project_schemas.ODKCentralDecrypted(
         odk_central_url=url,
         odk_central_user=user,
         odk_central_password=password,
     )
+
+    odk_creds_cache.set(project_id, odk_credentials)
+
+    return odk_credentials
+
+
+def invalidate_odk_credentials(project_id: Optional[int] = None) -> None:
+    """Drop cached ODK credentials for a project, or all if no project_id."""
+    odk_creds_cache.invalidate(project_id)
+
+
+async def get_project_etag(db: Session, project_id: int) -> Optional[str]:
+    """Get a weak ETag that changes whenever the project or its tasks change.
+
+    Built from the Postgres row versions (xmin) of the project, project info
+    and task rows, so it stays current without relying on a timestamp column.
+    The task history count and latest id cover new comments, which the
+    project response includes but which do not touch the task rows.
+
+    Returns:
+        Optional[str]: The ETag, or None if the project does not exist.
+    """
+    sql = text(
+        """
+    SELECT md5(string_agg(versions.row_version, ',' ORDER BY versions.row_version))
+    FROM (
+        SELECT 'p' || id || ':' || xmin::text AS row_version
+        FROM projects WHERE id = :project_id
+        UNION ALL
+        SELECT 'i' || project_id || ':' || xmin::text
+        FROM project_info WHERE project_id = :project_id
+        UNION ALL
+        SELECT 't' || id || ':' || xmin::text
+        FROM tasks WHERE project_id = :project_id
+        UNION ALL
+        SELECT 'h' || count(*) || ':' || coalesce(max(id), 0)
+        FROM task_history WHERE project_id = :project_id
+    ) AS versions
+    HAVING bool_or(versions.row_version LIKE 'p%')
+    """
+    )
+    version = db.execute(sql, {"project_id": project_id}).scalar()
+    if not version:
+        return None
+    return f'W/"{project_id}-{version}"'
+
+
+def require_ext(
+    field_name: str,
+    allowed_exts: frozenset[str],
+    required: bool = True,
+    status_code: HTTPStatus = HTTPStatus.BAD_REQUEST,
+):
+    """Depends factory to validate the extension of an uploaded file.
+
+    The check runs before the endpoint body, so invalid uploads are
+    rejected before the file contents are read into memory.
+
+    Args:
+        field_name (str): The form field name of the upload.
+        allowed_exts (frozenset[str]): Lowercase extensions, including the dot.
+        required (bool): If False, a missing upload returns None.
+        status_code (HTTPStatus): The error status to return on mismatch.
+
+    Returns:
+        Callable: A dependency returning the validated UploadFile.
+    """
+
+    async def validate_upload(
+        upload: Optional[UploadFile] = File(
+            ... if required else None, alias=field_name
+        ),
+    ) -> Optional[UploadFile]:
+        if not upload:
+            return None
+
+        file_ext = Path(upload.filename).suffix.lower()
+        if file_ext not in allowed_exts:
+            raise HTTPException(
+                status_code=status_code,
+                detail=f"Provide a valid {', '.join(sorted(allowed_exts))} file",
+            )
+        return upload
+
+    return validate_upload
+
+
+async def read_json_upload(upload: UploadFile) -> dict:
+    """Parse an uploaded JSON file, off the event loop.
+
+    The upload is read from its spooled temp file and parsed in one step,
+    so the raw bytes are freed as soon as parsing finishes.
+    """
+
+    def parse():
+        upload.file.seek(0)
+        return from_json(upload.file.read())
+
+    try:
+        return await run_in_threadpool(parse)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+            detail=f"{upload.filename} is not valid JSON: {e}",
+        ) from e
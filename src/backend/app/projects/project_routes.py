@@ -17,15 +17,15 @@
 #
 """Endpoints for FMTM projects."""
 
-import json
+import gzip
 import os
 import uuid
+from functools import lru_cache
+from hashlib import md5
 from io import BytesIO
 from pathlib import Path
 from typing import Optional
 
-import geojson
-import requests
 from fastapi import (
     APIRouter,
     BackgroundTasks,
@@ -34,24 +34,27 @@ from fastapi import (
     Form,
     HTTPException,
     Query,
+    Request,
     Response,
     UploadFile,
 )
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, StreamingResponse
 from loguru import logger as log
 from osm_fieldwork.data_models import data_models_path
 from osm_fieldwork.make_data_extract import getChoices
 from osm_fieldwork.xlsforms import xlsforms_path
 from sqlalchemy.orm import Session
-from sqlalchemy.sql import text
+from sqlalchemy.sql import select, text
 
 from app.auth.osm import AuthUser, login_required
 from app.auth.roles import mapper, org_admin, project_admin
+from app.cache import TTLCache
 from app.central import central_crud
 from app.db import database, db_models
 from app.db.postgis_utils import (
     check_crs,
-    flatgeobuf_to_geojson,
+    flatgeobuf_to_geojson_stream,
     parse_and_filter_geojson,
 )
 from app.models.enums import TILES_FORMATS, TILES_SOURCE, HTTPStatus
@@ -68,6 +71,68 @@ router = APIRouter(
 )
 
 
+# (page, results_per_page, user_id, hashtags, cursor): summaries JSON bytes
+summaries_cache = TTLCache(ttl=30)
+# project_id or None for all projects: centroids JSON
+centroids_cache = TTLCache(ttl=300)
+
+
+class ArchiveFileResponse(FileResponse):
+    """FileResponse reading large archives in 1MiB chunks (default 64KiB)."""
+
+    chunk_size = 1024 * 1024
+
+
+@lru_cache(maxsize=64)
+def get_template_stat(category: str) -> Optional[tuple[str, os.stat_result]]:
+    """Get the path and stat of an XLSForm template for a category.
+
+    Templates are bundled with osm_fieldwork and only change on redeploy,
+    so the result (including a missing file) is cached for the process.
+    """
+    xlsform_path = f"{xlsforms_path}/{category}.xls"
+    try:
+        return xlsform_path, os.stat(xlsform_path)
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=64)
+def get_template_gzip(category: str) -> Optional[bytes]:
+    """Get a gzip compressed XLSForm template, compressed once per process."""
+    if (template := project_crud.get_template_bytes(category)) is None:
+        return None
+    return gzip.compress(template, compresslevel=9)
+
+
+@lru_cache(maxsize=2)
+def get_upload_template(file_type: str) -> bytes:
+    """Get an example upload file, read once per process."""
+    file_type_paths = {
+        "data_extracts": f"{data_path}/template/template.geojson",
+        "form": f"{data_path}/template/template.xls",
+    }
+    return Path(file_type_paths[file_type]).read_bytes()
+
+
+@lru_cache(maxsize=1)
+def get_category_choices() -> dict:
+    """Get the form categories from osm_fieldwork, read once per process."""
+    return getChoices()
+
+
+def conditional_response(request: Request, response: Response) -> Response:
+    """Return 304 Not Modified if If-None-Match matches the response ETag.
+
+    Clients may cache the response, but must revalidate it on each use.
+    """
+    etag = response.headers.get("etag")
+    if etag and request.headers.get("if-none-match") == etag:
+        return Response(status_code=HTTPStatus.NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
 @router.get("/", response_model=list[project_schemas.ProjectOut])
 async def read_projects(
     user_id: int = None,
@@ -136,7 +201,7 @@ async def get_tasks_near_me(lat: float, long: float, user_id: int = None):
 
     TODO to be implemented in future.
     """
-    return [project_schemas.ProjectSummary()]
+    return []
 
 
 @router.get("/summaries", response_model=project_schemas.PaginatedProjectSummaries)
@@ -145,35 +210,51 @@ async def read_project_summaries(
     results_per_page: int = Query(13, le=100),
     user_id: Optional[int] = None,
     hashtags: Optional[str] = None,
+    cursor: Optional[int] = None,
     db: Session = Depends(database.get_db),
 ):
-    """Get a paginated summary of projects."""
+    """Get a paginated summary of projects.
+
+    Pass pagination.next_cursor back as cursor to fetch the next page
+    without an offset scan. Results may be up to 30 seconds old.
+
+    The page is serialised once by pydantic-core and returned as is,
+    skipping FastAPI's response_model validation and encoding.
+    """
     if hashtags:
         hashtags = hashtags.split(",")  # create list of hashtags
         hashtags = list(
             filter(lambda hashtag: hashtag.startswith("#"), hashtags)
         )  # filter hashtags that do start with #
 
-    total_projects = db.query(db_models.DbProject).count()
+    cache_key = (
+        page,
+        results_per_page,
+        user_id,
+        tuple(hashtags) if hashtags else None,
+        cursor,
+    )
+    if cached := summaries_cache.get(cache_key):
+        return Response(content=cached, media_type="application/json")
+
     skip = (page - 1) * results_per_page
     limit = results_per_page
 
     project_count, projects = await project_crud.get_project_summaries(
-        db, skip, limit, user_id, hashtags, None
+        db, skip, limit, user_id, hashtags, None, cursor
     )
 
     pagination = await project_crud.get_pagination(
-        page, project_count, results_per_page, total_projects
+        page, project_count, results_per_page, project_count
     )
-    project_summaries = [
-        project_schemas.ProjectSummary.from_db_project(project) for project in projects
-    ]
-
-    response = project_schemas.PaginatedProjectSummaries(
-        results=project_summaries,
+    if pagination.has_next and projects:
+        pagination.next_cursor = projects[-1].id
+    content = project_schemas.PaginatedProjectSummaries(
+        results=projects,
         pagination=pagination,
-    )
-    return response
+    ).model_dump_json()
+    summaries_cache.set(cache_key, content)
+    return Response(content=content, media_type="application/json")
 
 
 @router.get(
@@ -185,47 +266,62 @@ async def search_project(
     results_per_page: int = Query(13, le=100),
     user_id: Optional[int] = None,
     hashtags: Optional[str] = None,
+    cursor: Optional[int] = None,
     db: Session = Depends(database.get_db),
 ):
-    """Search projects by string, hashtag, or other criteria."""
+    """Search projects by string, hashtag, or other criteria.
+
+    Pass pagination.next_cursor back as cursor to fetch the next page
+    without an offset scan. Serialised once, as for /summaries.
+    """
     if hashtags:
         hashtags = hashtags.split(",")  # create list of hashtags
         hashtags = list(
             filter(lambda hashtag: hashtag.startswith("#"), hashtags)
         )  # filter hashtags that do start with #
 
-    total_projects = db.query(db_models.DbProject).count()
     skip = (page - 1) * results_per_page
     limit = results_per_page
 
     project_count, projects = await project_crud.get_project_summaries(
-        db, skip, limit, user_id, hashtags, search
+        db, skip, limit, user_id, hashtags, search, cursor
     )
 
     pagination = await project_crud.get_pagination(
-        page, project_count, results_per_page, total_projects
+        page, project_count, results_per_page, project_count
     )
-    project_summaries = [
-        project_schemas.ProjectSummary.from_db_project(project) for project in projects
-    ]
-
-    response = project_schemas.PaginatedProjectSummaries(
-        results=project_summaries,
+    if pagination.has_next and projects:
+        pagination.next_cursor = projects[-1].id
+    content = project_schemas.PaginatedProjectSummaries(
+        results=projects,
         pagination=pagination,
-    )
-    return response
+    ).model_dump_json()
+    return Response(content=content, media_type="application/json")
 
 
 @router.get("/{project_id}", response_model=project_schemas.ReadProject)
-async def read_project(project_id: int, db: Session = Depends(database.get_db)):
-    """Get a specific project by ID."""
-    project = await project_crud.get_project_by_id(db, project_id)
-    if not project:
+async def read_project(
+    project_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(database.get_db),
+):
+    """Get a specific project by ID.
+
+    Returns 304 Not Modified if the client already has the latest version.
+    """
+    etag = await project_deps.get_project_etag(db, project_id)
+    if not etag:
         raise HTTPException(status_code=404, detail="Project not found")
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=HTTPStatus.NOT_MODIFIED, headers={"ETag": etag})
+
+    project = await project_crud.get_project_by_id(db, project_id, load_tasks=True)
+    response.headers["ETag"] = etag
     return project
 
 
-@router.delete("/{project_id}")
+@router.delete("/{project_id}", status_code=HTTPStatus.NO_CONTENT)
 async def delete_project(
     db: Session = Depends(database.get_db),
     org_user_dict: db_models.DbUser = Depends(org_admin),
@@ -240,9 +336,14 @@ async def delete_project(
     # Odk crendentials
     odk_credentials = await project_deps.get_odk_credentials(db, project.id)
     # Delete ODK Central project
-    await central_crud.delete_odk_project(project.odkid, odk_credentials)
+    await run_in_threadpool(
+        central_crud.delete_odk_project, project.odkid, odk_credentials
+    )
     # Delete FMTM project
     await project_crud.delete_one_project(db, project)
+    project_deps.invalidate_odk_credentials(project.id)
+    project_crud.forms_cache.invalidate(project.id)
+    centroids_cache.invalidate()
 
     log.info(f"Deletion of project {project.id} successful")
     return Response(status_code=HTTPStatus.NO_CONTENT)
@@ -251,6 +352,7 @@ async def delete_project(
 @router.post("/create_project", response_model=project_schemas.ProjectOut)
 async def create_project(
     project_info: project_schemas.ProjectUpload,
+    background_tasks: BackgroundTasks,
     org_user_dict: db_models.DbUser = Depends(org_admin),
     db: Session = Depends(database.get_db),
 ):
@@ -288,6 +390,8 @@ async def create_project(
         )
         odk_creds_decrypted = await organisation_deps.get_org_odk_creds(db_org)
 
+    # Check before creating the ODK project; the unique index on lower(name)
+    # serves this lookup and still catches concurrent creates on insert
     sql = text(
         """
             SELECT EXISTS (
@@ -305,8 +409,12 @@ async def create_project(
             detail=f"Project already exists with the name "
             f"{project_info.project_info.name}",
         )
+    # End the read transaction, so the pooled connection is not held
+    # idle in transaction while waiting on ODK Central
+    db.commit()
 
-    odkproject = central_crud.create_odk_project(
+    odkproject = await run_in_threadpool(
+        central_crud.create_odk_project,
         project_info.project_info.name,
         odk_creds_decrypted,
     )
@@ -319,6 +427,8 @@ async def create_project(
     )
     if not project:
         raise HTTPException(status_code=404, detail="Project creation failed")
+    centroids_cache.invalidate()
+    background_tasks.add_task(project_crud.update_project_location, project.id)
 
     return project
 
@@ -350,6 +460,7 @@ async def update_project(
     )
     if not project:
         raise HTTPException(status_code=422, detail="Project could not be updated")
+    project_deps.invalidate_odk_credentials(project.id)
     return project
 
 
@@ -381,6 +492,7 @@ async def project_partial_update(
 
     if not project:
         raise HTTPException(status_code=422, detail="Project could not be updated")
+    project_deps.invalidate_odk_credentials(project_id)
     return project
 
 
@@ -403,9 +515,7 @@ async def upload_project_task_boundaries(
         dict: JSON containing success message, project ID, and number of tasks.
     """
     log.debug(f"Uploading project boundary multipolygon for project ID: {project_id}")
-    # read entire file
-    content = await task_geojson.read()
-    task_boundaries = json.loads(content)
+    task_boundaries = await project_deps.read_json_upload(task_geojson)
 
     # Validatiing Coordinate Reference System
     await check_crs(task_boundaries)
@@ -414,7 +524,7 @@ async def upload_project_task_boundaries(
     await project_crud.create_tasks_from_geojson(db, project_id, task_boundaries)
 
     # Get the number of tasks in a project
-    task_count = await tasks_crud.get_task_count_in_project(db, project_id)
+    task_count = tasks_crud.get_task_count_in_project(db, project_id)
 
     return {
         "message": "Project Boundary Uploaded",
@@ -428,7 +538,6 @@ async def task_split(
     project_geojson: UploadFile = File(...),
     extract_geojson: Optional[UploadFile] = File(None),
     no_of_buildings: int = Form(50),
-    db: Session = Depends(database.get_db),
 ):
     """Split a task into subtasks.
 
@@ -440,14 +549,12 @@ async def task_split(
             If not included, an extract is generated automatically.
         no_of_buildings (int, optional): The number of buildings per subtask.
             Defaults to 50.
-        db (Session, optional): The database session. Injected by FastAPI.
 
     Returns:
         The result of splitting the task into subtasks.
 
     """
-    # read project boundary
-    parsed_boundary = geojson.loads(await project_geojson.read())
+    parsed_boundary = await project_deps.read_json_upload(project_geojson)
     # Validatiing Coordinate Reference Systems
     await check_crs(parsed_boundary)
 
@@ -462,7 +569,6 @@ async def task_split(
             log.warning("Parsed geojson file contained no geometries")
 
     return await project_crud.split_geojson_into_tasks(
-        db,
         parsed_boundary,
         no_of_buildings,
         parsed_extract,
@@ -472,22 +578,15 @@ async def task_split(
 @router.post("/edit_project_boundary/{project_id}/")
 async def edit_project_boundary(
     project_id: int,
-    boundary_geojson: UploadFile = File(...),
+    boundary_geojson: UploadFile = Depends(
+        project_deps.require_ext("boundary_geojson", project_deps.GEOJSON_EXTS)
+    ),
     dimension: int = Form(500),
     db: Session = Depends(database.get_db),
     project_user_dict: dict = Depends(project_admin),
 ):
     """Edit the existing project boundary."""
-    # Validating for .geojson File.
-    file_name = os.path.splitext(boundary_geojson.filename)
-    file_ext = file_name[1]
-    allowed_extensions = [".geojson", ".json"]
-    if file_ext not in allowed_extensions:
-        raise HTTPException(status_code=400, detail="Provide a valid .geojson file")
-
-    # read entire file
-    content = await boundary_geojson.read()
-    boundary = json.loads(content)
+    boundary = await project_deps.read_json_upload(boundary_geojson)
 
     # Validatiing Coordinate Reference System
     await check_crs(boundary)
@@ -499,9 +598,11 @@ async def edit_project_boundary(
         raise HTTPException(
             status_code=428, detail=f"Project with id {project_id} does not exist"
         )
+    project_deps.invalidate_odk_credentials(project_id)
+    centroids_cache.invalidate()
 
     # Get the number of tasks in a project
-    task_count = await tasks_crud.get_task_count_in_project(db, project_id)
+    task_count = tasks_crud.get_task_count_in_project(db, project_id)
 
     return {
         "message": "Project Boundary Uploaded",
@@ -511,21 +612,17 @@ async def edit_project_boundary(
 
 
 @router.post("/validate-form")
-async def validate_form(form: UploadFile):
+async def validate_form(
+    form: UploadFile = Depends(
+        project_deps.require_ext("form", project_deps.XLSFORM_EXTS)
+    ),
+):
     """Tests the validity of the xls form uploaded.
 
     Parameters:
         - form: The xls form to validate
     """
-    file = Path(form.filename)
-    file_ext = file.suffix.lower()
-
-    allowed_extensions = [".xls", ".xlsx", ".xml"]
-    if file_ext not in allowed_extensions:
-        raise HTTPException(
-            status_code=400, detail="Provide a valid .xls,.xlsx,.xml file"
-        )
-
+    file_ext = Path(form.filename).suffix.lower()
     contents = await form.read()
     return await central_crud.read_and_test_xform(BytesIO(contents), file_ext)
 
@@ -534,7 +631,14 @@ async def validate_form(form: UploadFile):
 async def generate_files(
     background_tasks: BackgroundTasks,
     project_id: int,
-    xls_form_upload: Optional[UploadFile] = File(None),
+    xls_form_upload: Optional[UploadFile] = Depends(
+        project_deps.require_ext(
+            "xls_form_upload",
+            project_deps.XLSFORM_EXTS,
+            required=False,
+            status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+        )
+    ),
     db: Session = Depends(database.get_db),
     org_user_dict: db_models.DbUser = Depends(org_admin),
 ):
@@ -559,7 +663,7 @@ async def generate_files(
         org_user_dict (AuthUser): Current logged in user. Must be org admin.
 
     Returns:
-        json (JSONResponse): A success message containing the project ID.
+        json (dict): A success message containing the project ID.
     """
     log.debug(f"Generating media files tasks for project: {project_id}")
 
@@ -569,22 +673,12 @@ async def generate_files(
     custom_xls_form = None
     file_ext = None
     if xls_form_upload:
-        log.debug("Validating uploaded XLS form")
-
-        file_path = Path(xls_form_upload.filename)
-        file_ext = file_path.suffix.lower()
-        allowed_extensions = {".xls", ".xlsx", ".xml"}
-        if file_ext not in allowed_extensions:
-            raise HTTPException(
-                status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
-                detail=f"Invalid file extension, must be {allowed_extensions}",
-            )
-
+        file_ext = Path(xls_form_upload.filename).suffix.lower()
         custom_xls_form = await xls_form_upload.read()
 
-        # Write XLS form content to db
-        project.form_xls = custom_xls_form
-        db.commit()
+        # Write XLS form content to db, without flushing the whole project
+        if project_crud.update_project_form_xls(db, project_id, custom_xls_form):
+            db.commit()
 
     # Create task in db and return uuid
     log.debug(f"Creating export background task for project ID: {project_id}")
@@ -594,19 +688,15 @@ async def generate_files(
 
     log.debug(f"Submitting {background_task_id} to background tasks stack")
     background_tasks.add_task(
-        project_crud.generate_project_files,
-        db,
+        project_crud.generate_project_files_in_worker,
         project_id,
-        BytesIO(custom_xls_form) if custom_xls_form else None,
+        custom_xls_form,
         xform_category,
         file_ext if xls_form_upload else ".xls",
         background_task_id,
     )
 
-    return JSONResponse(
-        status_code=200,
-        content={"Message": f"{project_id}", "task_id": f"{background_task_id}"},
-    )
+    return {"Message": f"{project_id}", "task_id": f"{background_task_id}"}
 
 
 @router.get("/generate-log/")
@@ -629,48 +719,42 @@ async def generate_log(
     Task Status and Logs are returned in a JSON format.
     """
     try:
-        # Get the backgrund task status
-        task_status, task_message = await project_crud.get_background_task_status(
-            uuid, db
-        )
-
+        # Background task status and task progress in one round trip
         sql = text(
             """
+            WITH task_counts AS (
+                SELECT
+                    COUNT(*) FILTER (WHERE odk_token IS NOT NULL) AS tasks_complete,
+                    COUNT(*) AS total_tasks
+                FROM tasks
+                WHERE project_id = :project_id
+            )
             SELECT
-                COUNT(CASE WHEN odk_token IS NOT NULL THEN 1 END) AS tasks_complete,
-                COUNT(*) AS total_tasks
-            FROM tasks
-            WHERE project_id = :project_id;
+                background_tasks.status,
+                background_tasks.message,
+                task_counts.tasks_complete,
+                task_counts.total_tasks
+            FROM task_counts
+            LEFT JOIN background_tasks ON background_tasks.id = :task_id;
         """
         )
-        result = db.execute(sql, {"project_id": project_id})
-        row = result.fetchone()
-
-        tasks_generated = row[0] if row else 0
-        total_task_count = row[1] if row else 0
-
-        project_log_file = Path("/opt/logs/create_project.json")
-        project_log_file.touch(exist_ok=True)
-        with open(project_log_file, "r") as log_file:
-            logs = [json.loads(line) for line in log_file]
-
-            filtered_logs = [
-                log.get("record", {}).get("message", None)
-                for log in logs
-                if log.get("record", {}).get("extra", {}).get("project_id")
-                == project_id
-            ]
-            last_50_logs = filtered_logs[-50:]
-
-            logs = "\n".join(last_50_logs)
-
-            return {
-                "status": task_status.name,
-                "total_tasks": total_task_count,
-                "message": task_message,
-                "progress": tasks_generated,
-                "logs": logs,
-            }
+        row = db.execute(sql, {"project_id": project_id, "task_id": str(uuid)}).one()
+        if row.status is None:
+            log.warning(f"No background task found with UUID: {uuid}")
+            return "Error in generating log file"
+
+        last_50_logs = await run_in_threadpool(
+            project_crud.get_project_logs, project_id, 50
+        )
+        logs = "\n".join(last_50_logs)
+
+        return {
+            "status": row.status,
+            "total_tasks": row.total_tasks,
+            "message": row.message,
+            "progress": row.tasks_complete,
+            "logs": logs,
+        }
     except Exception as e:
         log.error(e)
         return "Error in generating log file"
@@ -687,30 +771,21 @@ async def get_categories(current_user: AuthUser = Depends(login_required)):
 
     """
     # FIXME update to use osm-rawdata
-    categories = (
-        getChoices()
-    )  # categories are fetched from osm_fieldwork.make_data_extracts.getChoices()
-    return categories
+    return get_category_choices()
 
 
 @router.post("/preview-split-by-square/")
 async def preview_split_by_square(
-    project_geojson: UploadFile = File(...), dimension: int = Form(100)
+    project_geojson: UploadFile = Depends(
+        project_deps.require_ext("project_geojson", project_deps.GEOJSON_EXTS)
+    ),
+    dimension: int = Form(100),
 ):
     """Preview splitting by square.
 
     TODO update to use a response_model
     """
-    # Validating for .geojson File.
-    file_name = os.path.splitext(project_geojson.filename)
-    file_ext = file_name[1]
-    allowed_extensions = [".geojson", ".json"]
-    if file_ext not in allowed_extensions:
-        raise HTTPException(status_code=400, detail="Provide a valid .geojson file")
-
-    # read entire file
-    content = await project_geojson.read()
-    boundary = geojson.loads(content)
+    boundary = await project_deps.read_json_upload(project_geojson)
 
     # Validatiing Coordinate Reference System
     await check_crs(boundary)
@@ -731,7 +806,7 @@ async def get_data_extract(
     TODO allow config file (YAML/JSON) upload for data extract generation
     TODO alternatively, direct to raw-data-api to generate first, then upload
     """
-    boundary_geojson = json.loads(await geojson_file.read())
+    boundary_geojson = await project_deps.read_json_upload(geojson_file)
 
     # Get extract config file from existing data_models
     if form_category:
@@ -746,7 +821,7 @@ async def get_data_extract(
         extract_config,
     )
 
-    return JSONResponse(status_code=200, content={"url": fgb_url})
+    return {"url": fgb_url}
 
 
 @router.get("/data-extract-url/")
@@ -763,12 +838,14 @@ async def get_or_set_data_extract(
         url,
     )
 
-    return JSONResponse(status_code=200, content={"url": fgb_url})
+    return {"url": fgb_url}
 
 
 @router.post("/upload-custom-extract/")
 async def upload_custom_extract(
-    custom_extract_file: UploadFile = File(...),
+    custom_extract_file: UploadFile = Depends(
+        project_deps.require_ext("custom_extract_file", project_deps.EXTRACT_EXTS)
+    ),
     project_id: int = Query(..., description="Project ID"),
     db: Session = Depends(database.get_db),
     project_user_dict: dict = Depends(project_admin),
@@ -793,19 +870,10 @@ async def upload_custom_extract(
     Query Params:
     - 'project_id' (int): the project's id. Required.
     """
-    # Validating for .geojson File.
-    file_name = os.path.splitext(custom_extract_file.filename)
-    file_ext = file_name[1]
-    allowed_extensions = [".geojson", ".json", ".fgb"]
-    if file_ext not in allowed_extensions:
-        raise HTTPException(
-            status_code=400, detail="Provide a valid .geojson or .fgb file"
-        )
-
     # read entire file
     extract_data = await custom_extract_file.read()
 
-    if file_ext == ".fgb":
+    if Path(custom_extract_file.filename).suffix.lower() == ".fgb":
         fgb_url = await project_crud.upload_custom_fgb_extract(
             db, project_id, extract_data
         )
@@ -813,36 +881,52 @@ async def upload_custom_extract(
         fgb_url = await project_crud.upload_custom_geojson_extract(
             db, project_id, extract_data
         )
-    return JSONResponse(status_code=200, content={"url": fgb_url})
+    return {"url": fgb_url}
 
 
 @router.get("/download-form/{project_id}/")
 async def download_form(
+    request: Request,
     project_id: int,
     db: Session = Depends(database.get_db),
     current_user: AuthUser = Depends(login_required),
 ):
-    """Download the XLSForm for a project."""
-    project = await project_crud.get_project(db, project_id)
+    """Download the XLSForm for a project.
 
+    Returns 304 Not Modified if the client already has the same form.
+    """
+    form_xls, xform_category, etag = project_crud.get_project_form(db, project_id)
+
+    if not form_xls:
+        if not (template := get_template_stat(xform_category)):
+            raise HTTPException(status_code=404, detail="Form not found")
+        xlsform_path, stat_result = template
+        response = FileResponse(
+            xlsform_path, filename="form.xls", stat_result=stat_result
+        )
+        return conditional_response(request, response)
+
+    # NOTE the blob is already in memory (and cached), so send it in one go
     headers = {
         "Content-Disposition": "attachment; filename=submission_data.xls",
         "Content-Type": "application/media",
+        "ETag": etag,
     }
-    if not project.form_xls:
-        xlsform_path = f"{xlsforms_path}/{project.xform_category}.xls"
-        if os.path.exists(xlsform_path):
-            return FileResponse(xlsform_path, filename="form.xls")
-        else:
-            raise HTTPException(status_code=404, detail="Form not found")
-    return Response(content=project.form_xls, headers=headers)
+    return conditional_response(request, Response(content=form_xls, headers=headers))
 
 
 @router.post("/update-form")
 async def update_project_form(
     background_tasks: BackgroundTasks,
     category: str = Form(...),
-    upload: Optional[UploadFile] = File(None),
+    upload: Optional[UploadFile] = Depends(
+        project_deps.require_ext(
+            "upload",
+            project_deps.XLSFORM_EXTS,
+            required=False,
+            status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+        )
+    ),
     db: Session = Depends(database.get_db),
     project_user_dict: dict = Depends(project_admin),
 ) -> project_schemas.ProjectBase:
@@ -861,26 +945,22 @@ async def update_project_form(
 
     if upload:
         file_ext = Path(upload.filename).suffix.lower()
-        allowed_extensions = [".xls", ".xlsx", ".xml"]
-        if file_ext not in allowed_extensions:
-            raise HTTPException(
-                status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
-                detail="Provide a valid .xls, .xlsx, .xml file.",
-            )
         new_xform_data = await upload.read()
         # Update the XLSForm blob in the database
-        project.form_xls = new_xform_data
+        project_crud.update_project_form_xls(db, project.id, new_xform_data)
         new_xform_data = BytesIO(new_xform_data)
     else:
-        xlsform_path = Path(f"{xlsforms_path}/{category}.xls")
-        file_ext = xlsform_path.suffix.lower()
-        with open(xlsform_path, "rb") as f:
-            new_xform_data = BytesIO(f.read())
+        template = await run_in_threadpool(project_crud.get_template_bytes, category)
+        if template is None:
+            raise HTTPException(
+                status_code=HTTPStatus.NOT_FOUND,
+                detail=f"No XLSForm template for category {category}",
+            )
+        file_ext = ".xls"
+        new_xform_data = BytesIO(template)
 
     # Update form category in database
     project.xform_category = category
-    # Commit changes to db
-    db.commit()
 
     # The reference to the form via ODK Central API (minus task_id)
     xform_name_prefix = project.project_name_prefix
@@ -888,7 +968,12 @@ async def update_project_form(
     # Get ODK Central credentials for project
     odk_creds = await project_deps.get_odk_credentials(db, project.id)
     # Get task id list
-    task_list = await tasks_crud.get_task_id_list(db, project.id)
+    task_list = tasks_crud.get_task_id_list(db, project.id)
+
+    # Commit all changes at once, before scheduling the ODK update
+    db.commit()
+    project_crud.forms_cache.invalidate(project.id)
+
     # Update ODK Central form data
     # FIXME runs in background but status is not tracked
     background_tasks.add_task(
@@ -906,71 +991,162 @@ async def update_project_form(
 
 @router.get("/download_template/")
 async def download_template(
+    request: Request,
     category: str,
     db: Session = Depends(database.get_db),
     current_user: AuthUser = Depends(mapper),
 ):
-    """Download an XLSForm template to fill out."""
-    xlsform_path = f"{xlsforms_path}/{category}.xls"
-    if os.path.exists(xlsform_path):
-        return FileResponse(xlsform_path, filename="form.xls")
-    else:
+    """Download an XLSForm template to fill out.
+
+    Served from memory, as the file is read (and gzip compressed,
+    if the client accepts it) once per process.
+    """
+    if not (template := get_template_stat(category)):
         raise HTTPException(status_code=404, detail="Form not found")
+    xlsform_path, stat_result = template
+
+    # NOTE passing stat_result sets the ETag from file mtime and size,
+    # the file itself is not opened
+    file_response = FileResponse(
+        xlsform_path, filename="form.xls", stat_result=stat_result
+    )
+    etag = file_response.headers["etag"].strip('"')
+    headers = {
+        "Content-Disposition": file_response.headers["content-disposition"],
+        "ETag": f'"{etag}"',
+        "Last-Modified": file_response.headers["last-modified"],
+        "Vary": "Accept-Encoding",
+    }
+
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        content = await run_in_threadpool(get_template_gzip, category)
+        headers["Content-Encoding"] = "gzip"
+        headers["ETag"] = f'"{etag}-gzip"'
+    else:
+        content = await run_in_threadpool(project_crud.get_template_bytes, category)
+
+    response = Response(
+        content=content, media_type=file_response.media_type, headers=headers
+    )
+    return conditional_response(request, response)
 
 
 @router.get("/{project_id}/download")
 async def download_project_boundary(
+    request: Request,
     project_id: int,
+    precision: int = Query(6, ge=0, le=15),
     db: Session = Depends(database.get_db),
     current_user: AuthUser = Depends(mapper),
 ):
     """Downloads the boundary of a project as a GeoJSON file.
 
     Args:
+        request (Request): The request, used for the If-None-Match header.
         project_id (int): The id of the project.
+        precision (int): Max decimal places in the coordinates, lower
+            values give smaller files for overviews.
         db (Session): The database session, provided automatically.
         current_user (AuthUser): Check if user is mapper.
 
     Returns:
         Response: The HTTP response object containing the downloaded file.
     """
-    out = await project_crud.get_project_geometry(db, project_id)
+    out = await project_crud.get_project_geometry(db, project_id, precision)
+    if not out:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail=f"No boundary found for project ({project_id})",
+        )
     headers = {
         "Content-Disposition": "attachment; filename=project_outline.geojson",
         "Content-Type": "application/media",
+        "ETag": f'"{md5(out.encode()).hexdigest()}"',
     }
 
-    return Response(content=out, headers=headers)
+    return conditional_response(request, Response(content=out, headers=headers))
 
 
 @router.get("/{project_id}/download_tasks")
 async def download_task_boundaries(
+    request: Request,
     project_id: int,
+    precision: int = Query(6, ge=0, le=15),
     db: Session = Depends(database.get_db),
     current_user: Session = Depends(mapper),
 ):
     """Downloads the boundary of the tasks for a project as a GeoJSON file.
 
+    Returns 304 Not Modified if the client already has the latest version.
+
     Args:
+        request (Request): The request, used for the If-None-Match header.
         project_id (int): The id of the project.
+        precision (int): Max decimal places in the coordinates, lower
+            values give smaller files for overviews.
         db (Session): The database session, provided automatically.
         current_user (AuthUser): Check if user has MAPPER permission.
 
     Returns:
-        Response: The HTTP response object containing the downloaded file.
+        StreamingResponse: The GeoJSON file, streamed per batch of tasks.
     """
-    out = await project_crud.get_task_geometry(db, project_id)
+    etag = await project_deps.get_project_etag(db, project_id)
+    if etag:
+        # The same tasks at another precision are a different file
+        etag = f'{etag[:-1]}-{precision}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=HTTPStatus.NOT_MODIFIED, headers={"ETag": etag})
+
+    chunks = await project_crud.get_task_geometry_stream(db, project_id, precision)
 
     headers = {
         "Content-Disposition": "attachment; filename=project_outline.geojson",
         "Content-Type": "application/media",
+        "Cache-Control": "private, no-cache",
     }
+    if etag:
+        headers["ETag"] = etag
+
+    return StreamingResponse(chunks, headers=headers)
+
+
+@router.get("/{project_id}/task-tiles/{z}/{x}/{y}.mvt")
+async def get_task_vector_tile(
+    project_id: int,
+    z: int,
+    x: int,
+    y: int,
+    db: Session = Depends(database.get_db),
+    current_user: AuthUser = Depends(mapper),
+):
+    """Get the task boundaries of a project as a Mapbox Vector Tile.
 
-    return Response(content=out, headers=headers)
+    Lets the map render tasks per viewport, instead of downloading
+    every task boundary as GeoJSON.
+
+    Args:
+        project_id (int): The id of the project.
+        z (int): Tile zoom level.
+        x (int): Tile column.
+        y (int): Tile row.
+        db (Session): The database session, provided automatically.
+        current_user (AuthUser): Check if user has MAPPER permission.
+
+    Returns:
+        Response: The MVT encoded tile, with a 'tasks' layer.
+    """
+    if not 0 <= z <= 22 or not (0 <= x < 2**z and 0 <= y < 2**z):
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail=f"Invalid tile coordinates {z}/{x}/{y}",
+        )
+    tile = await project_crud.get_task_vector_tile(db, project_id, z, x, y)
+    return Response(content=tile, media_type="application/vnd.mapbox-vector-tile")
 
 
 @router.get("/features/download/")
 async def download_features(
+    request: Request,
     project_id: int,
     task_id: Optional[int] = None,
     db: Session = Depends(database.get_db),
@@ -979,8 +1155,11 @@ async def download_features(
     """Downloads the features of a project as a GeoJSON file.
 
     Can generate a geojson for the entire project, or specific task areas.
+    The entire project is streamed, as it can contain many thousand features.
+    Returns 304 Not Modified if the client already has the latest version.
 
     Args:
+        request (Request): The request, used for the If-None-Match header.
         project_id (int): The id of the project.
         task_id (int): Specify a specific task area to download for.
         db (Session): The database session, provided automatically.
@@ -989,9 +1168,9 @@ async def download_features(
     Returns:
         Response: The HTTP response object containing the downloaded file.
     """
-    feature_collection = await project_crud.get_project_features_geojson(
-        db, project_id, task_id
-    )
+    etag = await project_deps.get_project_etag(db, project_id)
+    if etag and request.headers.get("if-none-match") == etag:
+        return Response(status_code=HTTPStatus.NOT_MODIFIED, headers={"ETag": etag})
 
     headers = {
         "Content-Disposition": (
@@ -999,8 +1178,17 @@ async def download_features(
         ),
         "Content-Type": "application/media",
     }
+    if etag:
+        headers["ETag"] = etag
 
-    return Response(content=json.dumps(feature_collection), headers=headers)
+    if not task_id:
+        chunks = await project_crud.get_project_features_geojson_stream(db, project_id)
+        return StreamingResponse(chunks, headers=headers)
+
+    feature_collection = await project_crud.get_task_features_geojson(
+        db, project_id, task_id
+    )
+    return Response(content=feature_collection, headers=headers)
 
 
 @router.get("/convert-fgb-to-geojson/")
@@ -1021,17 +1209,17 @@ async def convert_fgb_to_geojson(
         current_user (AuthUser): Check if user is logged in.
 
     Returns:
-        Response: The HTTP response object containing the downloaded file.
+        StreamingResponse: The GeoJSON file, streamed per batch of features.
     """
-    with requests.get(url) as response:
-        if not response.ok:
-            raise HTTPException(
-                status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
-                detail="Download failed for data extract",
-            )
-        data_extract_geojson = await flatgeobuf_to_geojson(db, response.content)
+    flatgeobuf = await run_in_threadpool(project_crud.fetch_flatgeobuf, url)
+    if not flatgeobuf:
+        raise HTTPException(
+            status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+            detail="Download failed for data extract",
+        )
+    chunks = await flatgeobuf_to_geojson_stream(db, flatgeobuf)
 
-    if not data_extract_geojson:
+    if not chunks:
         raise HTTPException(
             status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
             detail=("Failed to convert flatgeobuf --> geojson"),
@@ -1042,7 +1230,7 @@ async def convert_fgb_to_geojson(
         "Content-Type": "application/media",
     }
 
-    return Response(content=json.dumps(data_extract_geojson), headers=headers)
+    return StreamingResponse(chunks, headers=headers)
 
 
 @router.get("/tiles/{project_id}")
@@ -1101,59 +1289,89 @@ async def generate_project_tiles(
 @router.get("/tiles_list/{project_id}/")
 async def tiles_list(
     project_id: int,
+    limit: int = Query(50, ge=1, le=500),
+    before_id: Optional[int] = None,
     db: Session = Depends(database.get_db),
     current_user: AuthUser = Depends(login_required),
 ):
-    """Returns the list of tiles for a project.
+    """Returns the list of tiles for a project, newest first.
 
     Parameters:
         project_id: int
+        limit (int): Maximum number of tile archives to return.
+        before_id (int): Pass the id of the last item to get the next page.
         db (Session): The database session, provided automatically.
         current_user (AuthUser): Check if user is logged in.
 
     Returns:
         Response: List of generated tiles for a project.
     """
-    return await project_crud.get_mbtiles_list(db, project_id)
+    return await project_crud.get_mbtiles_list(db, project_id, limit, before_id)
 
 
 @router.get("/download_tiles/")
 async def download_tiles(
+    request: Request,
     tile_id: int,
     db: Session = Depends(database.get_db),
     current_user: AuthUser = Depends(login_required),
 ):
     """Download the basemap tile archive for a project."""
     log.debug("Getting tile archive path from DB")
-    tiles_path = (
-        db.query(db_models.DbTilesPath)
-        .filter(db_models.DbTilesPath.id == str(tile_id))
-        .first()
-    )
+    tiles_path = db.execute(
+        select(
+            db_models.DbTilesPath.path,
+            db_models.DbTilesPath.project_id,
+            db_models.DbProject.project_name_prefix,
+        )
+        .join(
+            db_models.DbProject,
+            db_models.DbProject.id == db_models.DbTilesPath.project_id,
+        )
+        .where(db_models.DbTilesPath.id == tile_id)
+    ).first()
+    if not tiles_path:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail=f"Tile archive with ID {tile_id} does not exist",
+        )
     log.info(f"User requested download for tiles: {tiles_path.path}")
 
-    project_id = tiles_path.project_id
-    project = await project_crud.get_project(db, project_id)
     filename = Path(tiles_path.path).name.replace(
-        f"{project_id}_", f"{project.project_name_prefix}_"
+        f"{tiles_path.project_id}_", f"{tiles_path.project_name_prefix}_"
     )
     log.debug(f"Sending tile archive to user: {filename}")
 
-    return FileResponse(
+    try:
+        stat_result = await run_in_threadpool(os.stat, tiles_path.path)
+    except FileNotFoundError as e:
+        log.error(f"Tile archive missing on disk: {tiles_path.path}")
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND, detail="Tile archive not found"
+        ) from e
+
+    response = ArchiveFileResponse(
         tiles_path.path,
+        stat_result=stat_result,
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
+    return conditional_response(request, response)
 
 
 @router.get("/boundary_in_osm/{project_id}/")
 async def download_task_boundary_osm(
+    request: Request,
     project_id: int,
     db: Session = Depends(database.get_db),
     current_user: AuthUser = Depends(mapper),
 ):
     """Downloads the boundary of a task as a OSM file.
 
+    Returns 304 Not Modified before any conversion,
+    if the client already has the latest version.
+
     Args:
+        request (Request): The request, used for the If-None-Match header.
         project_id (int): The id of the project.
         db (Session): The database session, provided automatically.
         current_user (AuthUser): Check if user has MAPPER permission.
@@ -1161,48 +1379,68 @@ async def download_task_boundary_osm(
     Returns:
         Response: The HTTP response object containing the downloaded file.
     """
-    out = await project_crud.get_task_geometry(db, project_id)
-    file_path = f"/tmp/{project_id}_task_boundary.geojson"
+    etag = await project_deps.get_project_etag(db, project_id)
+    if etag and request.headers.get("if-none-match") == etag:
+        return Response(status_code=HTTPStatus.NOT_MODIFIED, headers={"ETag": etag})
 
-    # Write the response content to the file
-    with open(file_path, "w") as f:
-        f.write(out)
-    result = await project_crud.convert_geojson_to_osm(file_path)
+    out = await project_crud.get_task_geometry(db, project_id)
+    content = await run_in_threadpool(project_crud.convert_geojson_to_osm, out)
+    response = Response(content=content, media_type="application/xml")
+    if etag:
+        response.headers["ETag"] = etag
+    return conditional_response(request, response)
 
-    with open(result, "r") as f:
-        content = f.read()
 
-    response = Response(content=content, media_type="application/xml")
-    return response
+# Module level, so the compiled statement is reused across requests
+# NOTE 6 decimal places is ~10cm, plenty for a map marker
+PROJECT_CENTROIDS_SQL = text(
+    """
+    SELECT COALESCE(
+        jsonb_agg(
+            jsonb_build_object(
+                'id', id,
+                'centroid', jsonb_build_array(
+                    jsonb_build_array(
+                        ROUND(ST_X(centroid.geom)::numeric, 6),
+                        ROUND(ST_Y(centroid.geom)::numeric, 6)
+                    )
+                )
+            )
+            ORDER BY id
+        ),
+        '[]'::jsonb
+    )::text
+    FROM projects, LATERAL ST_Centroid(outline) AS centroid(geom)
+    WHERE CAST(:project_id AS integer) IS NULL OR id = :project_id;
+    """
+)
 
 
 @router.get("/centroid/")
-async def project_centroid(
+def project_centroid(
     project_id: int = None,
     db: Session = Depends(database.get_db),
 ):
     """Get a centroid of each projects.
 
+    A sync def, so FastAPI runs the query in the threadpool.
+    Results are cached, as outlines only change on project create,
+    delete or boundary edit, which clear the cache.
+
     Parameters:
         project_id (int): The ID of the project.
         db (Session): The database session, provided automatically.
 
     Returns:
-        list[tuple[int, str]]: A list of tuples containing the task ID and
-            the centroid as a string.
+        Response: JSON list of {"id": int, "centroid": [[x, y]]} objects,
+            built entirely in PostGIS.
     """
-    query = text(
-        f"""SELECT id,
-            ARRAY_AGG(ARRAY[ST_X(ST_Centroid(outline)),
-            ST_Y(ST_Centroid(outline))]) AS centroid
-            FROM projects
-            WHERE {f"id={project_id}" if project_id else "1=1"}
-            GROUP BY id;"""
-    )
-
-    result = db.execute(query)
-    result_dict_list = [{"id": row[0], "centroid": row[1]} for row in result.fetchall()]
-    return result_dict_list
+    project_id = project_id or None
+    if (centroids := centroids_cache.get(project_id)) is None:
+        result = db.execute(PROJECT_CENTROIDS_SQL, {"project_id": project_id})
+        centroids = result.scalar()
+        centroids_cache.set(project_id, centroids)
+    return Response(content=centroids, media_type="application/json")
 
 
 @router.get("/task-status/{uuid}", response_model=project_schemas.BackgroundTaskStatus)
@@ -1234,16 +1472,14 @@ async def get_template_file(
 
     Args: file_type: Type of template file.
 
-    returns: Requested file as a FileResponse.
+    returns: Requested file, served from memory after the first read.
     """
-    file_type_paths = {
-        "data_extracts": f"{data_path}/template/template.geojson",
-        "form": f"{data_path}/template/template.xls",
-    }
-    file_path = file_type_paths.get(file_type)
-    filename = file_path.split("/")[-1]
-    return FileResponse(
-        file_path, media_type="application/octet-stream", filename=filename
+    filename = "template.geojson" if file_type == "data_extracts" else "template.xls"
+    content = await run_in_threadpool(get_upload_template, file_type)
+    return Response(
+        content=content,
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
 
 
@@ -1276,30 +1512,34 @@ async def project_dashboard(
     )
     # Update submissions in S3
     background_tasks.add_task(
-        submission_crud.update_submission_in_s3, db, db_project.id, background_task_id
+        submission_crud.update_submission_in_s3_in_worker,
+        db_project.id,
+        background_task_id,
     )
 
     return data
 
 
 @router.get("/contributors/{project_id}")
-async def get_contributors(
+def get_contributors(
     project_id: int,
     db: Session = Depends(database.get_db),
     current_user: AuthUser = Depends(mapper),
 ):
     """Get contributors of a project.
 
+    A sync def, so FastAPI runs the query in the threadpool.
+
     Args:
         project_id (int): ID of project.
         db (Session): The database session.
         current_user (AuthUser): Check if user is mapper.
 
     Returns:
-        list[project_schemas.ProjectUser]: List of project users.
+        Response: JSON list of project users and their contribution count.
     """
-    project_users = await project_crud.get_project_users(db, project_id)
-    return project_users
+    project_users = project_crud.get_project_users(db, project_id)
+    return Response(content=project_users, media_type="application/json")
 
 
 @router.post("/add_admin/")
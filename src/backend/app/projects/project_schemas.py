@@ -19,6 +19,7 @@
 
 import uuid
 from datetime import datetime
+from functools import cached_property
 from typing import Any, List, Optional, Union
 
 from dateutil import parser
@@ -35,7 +36,6 @@ from app.db import db_models
 from app.db.postgis_utils import (
     geojson_to_geometry,
     geometry_to_geojson,
-    get_address_from_lat_lon,
     read_wkb,
     write_wkb,
 )
@@ -148,7 +148,7 @@ class ProjectIn(BaseModel):
     # country: str
 
     @computed_field
-    @property
+    @cached_property
     def outline(self) -> Optional[Any]:
         """Compute WKBElement geom from geojson."""
         if not self.outline_geojson:
@@ -156,24 +156,17 @@ class ProjectIn(BaseModel):
         return geojson_to_geometry(self.outline_geojson)
 
     @computed_field
-    @property
+    @cached_property
     def centroid(self) -> Optional[Any]:
-        """Compute centroid for project outline."""
+        """Compute centroid for project outline.
+
+        The geocoded location_str is set after creation,
+        by project_crud.update_project_location.
+        """
         if not self.outline:
             return None
         return write_wkb(read_wkb(self.outline).centroid)
 
-    @computed_field
-    @property
-    def location_str(self) -> Optional[str]:
-        """Compute geocoded location string from centroid."""
-        if not self.centroid:
-            return None
-        geom = read_wkb(self.centroid)
-        latitude, longitude = geom.y, geom.x
-        address = get_address_from_lat_lon(latitude, longitude)
-        return address if address is not None else ""
-
     @computed_field
     @property
     def project_name_prefix(self) -> str:
@@ -293,6 +286,7 @@ class PaginationInfo(BaseModel):
     prev_num: Optional[int]
     per_page: int
     total: int
+    next_cursor: Optional[int] = None
 
 
 class PaginatedProjectSummaries(BaseModel):
@@ -337,13 +331,13 @@ class ProjectWithTasks(ProjectBase):
 class ProjectOut(ProjectWithTasks):
     """Project display to user."""
 
-    project_uuid: uuid.UUID = uuid.uuid4()
+    project_uuid: uuid.UUID
 
 
 class ReadProject(ProjectWithTasks):
     """Redundant model for refactor."""
 
-    project_uuid: uuid.UUID = uuid.uuid4()
+    project_uuid: uuid.UUID
     location_str: Optional[str] = None
     data_extract_url: Optional[str] = None
 
@@ -373,7 +367,15 @@ class ProjectDashboard(BaseModel):
         if value is None:
             return None
 
-        last_active = parser.parse(value).replace(tzinfo=None)
+        if isinstance(value, datetime):
+            last_active = value
+        else:
+            try:
+                # C parser, far faster than dateutil for ODK's ISO timestamps
+                last_active = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            except ValueError:
+                last_active = parser.parse(value)
+        last_active = last_active.replace(tzinfo=None)
         current_date = datetime.now()
 
         time_difference = current_date - last_active
@@ -24,9 +24,13 @@ import json
 import os
 import threading
 import uuid
+from asyncio import get_running_loop
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache, partial
 from io import BytesIO
+from multiprocessing import get_context
 from typing import Optional
 
 import sozipfile.sozipfile as zipfile
@@ -41,12 +45,32 @@ from sqlalchemy.orm import Session
 from app.central.central_crud import get_odk_form, get_odk_project, list_odk_xforms
 from app.config import settings
 from app.db import db_models
+from app.db.database import SessionLocal
 from app.models.enums import HTTPStatus
 from app.projects import project_crud, project_deps
 from app.s3 import add_obj_to_bucket, get_obj_from_bucket
 from app.tasks import tasks_crud
 
 
+@lru_cache(maxsize=1)
+def submissions_pool() -> ProcessPoolExecutor:
+    """Get the pool syncing project submissions to S3.
+
+    Submission syncs download every submission from ODK Central, so run
+    in worker processes (spawn, as for the project_crud pools).
+    Created on first use, so it is recreated if the app restarts
+    after shutdown_submissions_pool.
+    """
+    return ProcessPoolExecutor(max_workers=2, mp_context=get_context("spawn"))
+
+
+def shutdown_submissions_pool() -> None:
+    """Stop the submissions worker processes, on shutdown."""
+    if submissions_pool.cache_info().currsize:
+        submissions_pool().shutdown()
+        submissions_pool.cache_clear()
+
+
 def get_submission_of_project(db: Session, project_id: int, task_id: int = None):
     """Gets the submission of project.
 
@@ -413,6 +437,34 @@ def update_submission_in_s3(
         update_bg_task_sync(db, background_task_id, 2, str(e))  # 2 is FAILED
 
 
+def update_submission_in_s3_with_session(
+    project_id: int, background_task_id: uuid.UUID
+):
+    """Run update_submission_in_s3 with a db session of its own.
+
+    For use in a worker process, where the request session is not available.
+    """
+    db = SessionLocal()
+    try:
+        update_submission_in_s3(db, project_id, background_task_id)
+    finally:
+        db.close()
+
+
+async def update_submission_in_s3_in_worker(
+    project_id: int, background_task_id: uuid.UUID
+):
+    """Sync the submissions of a project to S3 in the submissions pool.
+
+    Keeps the ODK Central download and zipping out of the web worker.
+    """
+    loop = get_running_loop()
+    await loop.run_in_executor(
+        submissions_pool(),
+        partial(update_submission_in_s3_with_session, project_id, background_task_id),
+    )
+
+
 def get_all_submissions_json(db: Session, project_id):
     """Get all submissions for a project in JSON format."""
     get_project_sync = async_to_sync(project_crud.get_project)
@@ -423,8 +475,7 @@ def get_all_submissions_json(db: Session, project_id):
     odk_credentials = odk_sync(db, project_id)
     project = get_odk_project(odk_credentials)
 
-    get_task_id_list_sync = async_to_sync(tasks_crud.get_task_id_list)
-    task_list = get_task_id_list_sync(db, project_id)
+    task_list = tasks_crud.get_task_id_list(db, project_id)
     xform_list = [
         f"{project_info.project_name_prefix}_task_{task}" for task in task_list
     ]
@@ -254,7 +254,9 @@ async def download_submission_json(
     )
 
     background_tasks.add_task(
-        submission_crud.update_submission_in_s3, db, project_id, background_task_id
+        submission_crud.update_submission_in_s3_in_worker,
+        project_id,
+        background_task_id,
     )
     return JSONResponse(
         status_code=200,
@@ -335,7 +337,9 @@ async def get_submission_page(
     )
 
     background_tasks.add_task(
-        submission_crud.update_submission_in_s3, db, project_id, background_task_id
+        submission_crud.update_submission_in_s3_in_worker,
+        project_id,
+        background_task_id,
     )
 
     return data
@@ -358,7 +362,7 @@ async def get_submission_form_fields(
         Any: The response from the submission form API.
     """
     project = await project_crud.get_project(db, project_id)
-    task_list = await tasks_crud.get_task_id_list(db, project_id)
+    task_list = tasks_crud.get_task_id_list(db, project_id)
     odk_credentials = await project_deps.get_odk_credentials(db, project_id)
     odk_form = central_crud.get_odk_form(odk_credentials)
     xform = f"{project.project_name_prefix}_task_{task_list[0]}"
@@ -397,7 +401,9 @@ async def submission_table(
     )
 
     background_tasks.add_task(
-        submission_crud.update_submission_in_s3, db, project_id, background_task_id
+        submission_crud.update_submission_in_s3_in_worker,
+        project_id,
+        background_task_id,
     )
     pagination = await project_crud.get_pagination(page, count, results_per_page, count)
     response = submission_schemas.PaginatedSubmissions(
@@ -17,15 +17,18 @@
 #
 """Logic for FMTM tasks."""
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Optional
 
 from fastapi import Depends, HTTPException
 from loguru import logger as log
-from sqlalchemy.orm import Session
+from sqlalchemy import func, inspect, select
+from sqlalchemy.orm import Session, defer, joinedload, load_only, selectinload
+from sqlalchemy.orm.exc import StaleDataError
 from sqlalchemy.sql import text
 
 from app.auth.osm import AuthUser
+from app.cache import TTLCache
 from app.db import database, db_models
 from app.models.enums import (
     TaskStatus,
@@ -33,151 +36,215 @@ from app.models.enums import (
     verify_valid_status_update,
 )
 from app.tasks import tasks_schemas
-from app.users import user_crud
 
+# (project_id, task_id): list of task comment dicts
+task_comments_cache = TTLCache(ttl=15)
 
-async def get_task_count_in_project(db: Session, project_id: int):
-    """Get task count for a project."""
-    query = text(f"""select count(*) from tasks where project_id = {project_id}""")
-    result = db.execute(query)
-    return result.fetchone()[0]
+# Statuses that hold a lock on the task for the acting user
+LOCKED_STATUSES = frozenset(
+    {TaskStatus.LOCKED_FOR_MAPPING, TaskStatus.LOCKED_FOR_VALIDATION}
+)
+# status: (user column it updates, set to the acting user or cleared)
+STATUS_USER_COLUMNS = {
+    TaskStatus.MAPPED: ("mapped_by", True),
+    TaskStatus.VALIDATED: ("validated_by", True),
+    TaskStatus.INVALIDATED: ("mapped_by", False),
+}
 
 
-async def get_task_id_list(db: Session, project_id: int) -> list[int]:
-    """Get a list of tasks id for a project."""
-    query = text(
-        """
-        SELECT id
-        FROM tasks
-        WHERE project_id = :project_id
-    """
+def get_task_count_in_project(db: Session, project_id: int) -> int:
+    """Get task count for a project."""
+    # count(*) rather than count(id), so ix_tasks_project_id can serve
+    # the query as an index-only scan without visiting the heap
+    return (
+        db.query(func.count())
+        .select_from(db_models.DbTask)
+        .filter(db_models.DbTask.project_id == project_id)
+        .scalar()
     )
 
-    # Then execute the query with the desired parameter
-    result = db.execute(query, {"project_id": project_id})
 
-    # Fetch the result
-    task_ids = [row.id for row in result]
-    return task_ids
+def get_task_id_list(db: Session, project_id: int) -> list[int]:
+    """Get a list of tasks id for a project."""
+    query = select(db_models.DbTask.id).where(db_models.DbTask.project_id == project_id)
+    # Scalars skips building a Row wrapper per task
+    return list(db.execute(query).scalars())
 
 
-async def get_tasks(
+def get_tasks(
     db: Session, project_id: int, user_id: int, skip: int = 0, limit: int = 1000
 ):
     """Get task details for a project."""
+    # Load history and the acting users up front, one query per relationship.
+    # geometry_geojson duplicates outline and is not part of the task schemas
+    query = db.query(db_models.DbTask).options(
+        defer(db_models.DbTask.geometry_geojson),
+        joinedload(db_models.DbTask.lock_holder),
+        selectinload(db_models.DbTask.task_history).selectinload(
+            db_models.DbTaskHistory.actioned_by
+        ),
+    )
     if project_id:
-        db_tasks = (
-            db.query(db_models.DbTask)
-            .filter(db_models.DbTask.project_id == project_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        query = query.filter(db_models.DbTask.project_id == project_id)
     elif user_id:
-        db_tasks = (
-            db.query(db_models.DbTask)
-            .filter(db_models.DbTask.locked_by == user_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
-    else:
-        db_tasks = db.query(db_models.DbTask).offset(skip).limit(limit).all()
-    return db_tasks
+        query = query.filter(db_models.DbTask.locked_by == user_id)
+    return query.offset(skip).limit(limit).all()
 
 
-async def get_task(db: Session, task_id: int) -> db_models.DbTask:
+def get_task(db: Session, task_id: int) -> db_models.DbTask:
     """Get details for a specific task ID."""
     log.debug(f"Getting task with ID '{task_id}' from database")
-    return db.query(db_models.DbTask).filter(db_models.DbTask.id == task_id).first()
+    query = select(db_models.DbTask).where(db_models.DbTask.id == task_id)
+    return db.execute(query).scalar_one_or_none()
 
 
-async def update_task_status(
-    db: Session, user_id: int, task_id: int, new_status: TaskStatus
-):
+def update_task_status(db: Session, user_id: int, task_id: int, new_status: TaskStatus):
     """Update the status of a task."""
     log.debug(f"Updating task ID {task_id} to status {new_status}")
     if not user_id:
         log.error(f"User id is not present: {user_id}")
         raise HTTPException(status_code=400, detail="User id required.")
 
-    db_user = await user_crud.get_user(db, user_id)
+    # Fetch the task and user in one round trip. The task is not locked,
+    # DbTask's version_id rejects the update if it changed meanwhile
+    task_and_user = (
+        db.query(db_models.DbTask, db_models.DbUser)
+        .join(db_models.DbUser, db_models.DbUser.id == user_id)
+        .filter(db_models.DbTask.id == task_id)
+        .first()
+    )
+    if task_and_user:
+        db_task, db_user = task_and_user
+    else:
+        db_user = db.get(db_models.DbUser, user_id)
+        if not db_user:
+            msg = f"User with id {user_id} does not exist."
+            log.error(msg)
+            raise HTTPException(status_code=400, detail=msg)
+        db_task = None
+    log.debug(f"Returned task from db: {db_task}")
+
+    if db_task:
+        db.add(apply_task_status_change(db_task, db_user, new_status))
+
+        # Expired attributes reload on first access, so no refresh is needed
+        try:
+            db.commit()
+        except StaleDataError:
+            db.rollback()
+            msg = f"Task {task_id} was updated by another user, please retry."
+            log.warning(msg)
+            raise HTTPException(status_code=409, detail=msg) from None
+        return db_task
+
+    else:
+        msg = f"Task with id {task_id} does not exist."
+        log.error(msg)
+        raise HTTPException(status_code=404, detail=msg)
+
+
+def update_task_status_bulk(
+    db: Session,
+    user_id: int,
+    project_id: int,
+    status_updates: list[tasks_schemas.TaskStatusUpdate],
+) -> list[db_models.DbTask]:
+    """Update the status of many tasks in a project, in one transaction.
+
+    The tasks are loaded with a single query and all history entries
+    are flushed together on commit.
+    """
+    log.debug(f"Updating {len(status_updates)} task statuses in project {project_id}")
+    db_user = db.get(db_models.DbUser, user_id)
     if not db_user:
         msg = f"User with id {user_id} does not exist."
         log.error(msg)
         raise HTTPException(status_code=400, detail=msg)
 
-    db_task = await get_task(db, task_id)
-    log.debug(f"Returned task from db: {db_task}")
+    task_ids = {update.task_id for update in status_updates}
+    db_tasks = {
+        task.id: task
+        for task in db.query(db_models.DbTask).filter(
+            db_models.DbTask.project_id == project_id,
+            db_models.DbTask.id.in_(task_ids),
+        )
+    }
+    if missing_ids := task_ids - db_tasks.keys():
+        msg = f"Tasks {sorted(missing_ids)} do not exist in project {project_id}."
+        log.error(msg)
+        raise HTTPException(status_code=404, detail=msg)
 
-    if db_task:
-        if db_task.task_status in [
-            TaskStatus.LOCKED_FOR_MAPPING,
-            TaskStatus.LOCKED_FOR_VALIDATION,
-        ]:
-            log.debug(f"Task {task_id} currently locked")
-            if not (user_id is not db_task.locked_by):
-                msg = (
-                    f"User {user_id} with username {db_user.username} "
-                    "has not locked this task."
-                )
-                log.error(msg)
-                raise HTTPException(
-                    status_code=403,
-                    detail=msg,
-                )
-
-        if not verify_valid_status_update(db_task.task_status, new_status):
-            msg = f"{new_status} is not a valid task status"
-            log.error(msg)
-            raise HTTPException(
-                status_code=422,
-                detail=msg,
+    try:
+        history_entries = [
+            apply_task_status_change(
+                db_tasks[update.task_id], db_user, update.new_status
             )
+            for update in status_updates
+        ]
+    except HTTPException:
+        # Discard changes already applied to earlier tasks in the batch
+        db.rollback()
+        raise
+    db.add_all(history_entries)
+
+    try:
+        db.commit()
+    except StaleDataError:
+        db.rollback()
+        msg = "Tasks were updated by another user, please retry."
+        log.warning(msg)
+        raise HTTPException(status_code=409, detail=msg) from None
+    return list(db_tasks.values())
 
-        # update history prior to updating task
-        update_history = await create_task_history_for_status_change(
-            db_task, new_status, db_user
-        )
-        db.add(update_history)
 
-        db_task.task_status = new_status
+# ---------------------------
+# ---- SUPPORT FUNCTIONS ----
+# ---------------------------
 
-        if new_status in [
-            TaskStatus.LOCKED_FOR_MAPPING,
-            TaskStatus.LOCKED_FOR_VALIDATION,
-        ]:
-            db_task.locked_by = db_user.id
-        else:
-            db_task.locked_by = None
 
-        if new_status == TaskStatus.MAPPED:
-            db_task.mapped_by = db_user.id
-        if new_status == TaskStatus.VALIDATED:
-            db_task.validated_by = db_user.id
-        if new_status == TaskStatus.INVALIDATED:
-            db_task.mapped_by = None
+def apply_task_status_change(
+    db_task: db_models.DbTask, db_user: db_models.DbUser, new_status: TaskStatus
+) -> db_models.DbTaskHistory:
+    """Check and apply a status change to a task, without committing.
 
-        db.commit()
-        db.refresh(db_task)
-        return db_task
+    Returns:
+        DbTaskHistory: The history entry recording the change, to be added
+            to the session by the caller.
+    """
+    if db_task.task_status in LOCKED_STATUSES:
+        log.debug(f"Task {db_task.id} currently locked")
+        if db_user.id != db_task.locked_by:
+            msg = (
+                f"User {db_user.id} with username {db_user.username} "
+                "has not locked this task."
+            )
+            log.error(msg)
+            raise HTTPException(
+                status_code=403,
+                detail=msg,
+            )
 
-    else:
+    if not verify_valid_status_update(db_task.task_status, new_status):
+        msg = f"{new_status} is not a valid task status"
+        log.error(msg)
         raise HTTPException(
-            status_code=400,
-            detail=(
-                f"Not a valid status update: "
-                f"{db_task.task_status.name} to {new_status.name}"
-            ),
+            status_code=422,
+            detail=msg,
         )
 
+    # update history prior to updating task
+    update_history = create_task_history_for_status_change(db_task, new_status, db_user)
 
-# ---------------------------
-# ---- SUPPORT FUNCTIONS ----
-# ---------------------------
+    db_task.task_status = new_status
+    db_task.locked_by = db_user.id if new_status in LOCKED_STATUSES else None
+    if user_column := STATUS_USER_COLUMNS.get(new_status):
+        column, set_user = user_column
+        setattr(db_task, column, db_user.id if set_user else None)
+
+    return update_history
 
 
-async def create_task_history_for_status_change(
+def create_task_history_for_status_change(
     db_task: db_models.DbTask, new_status: TaskStatus, db_user: db_models.DbUser
 ):
     """Append task status change to task history."""
@@ -194,6 +261,7 @@ async def create_task_history_for_status_change(
         action_text=msg,
         actioned_by=db_user,
         user_id=db_user.id,
+        new_status=new_status,
     )
 
     # TODO add invalidation history
@@ -216,8 +284,12 @@ async def create_task_history_for_status_change(
 # TODO: write tests for these
 
 
-async def get_task_comments(db: Session, project_id: int, task_id: int):
+def get_task_comments(db: Session, project_id: int, task_id: int):
     """Get a list of tasks id for a project."""
+    cache_key = (project_id, task_id)
+    if (cached := task_comments_cache.get(cache_key)) is not None:
+        return cached
+
     query = text(
         """
         SELECT
@@ -250,10 +322,11 @@ async def get_task_comments(db: Session, project_id: int, task_id: int):
         for row in result.fetchall()
     ]
 
+    task_comments_cache.set(cache_key, result_dict_list)
     return result_dict_list
 
 
-async def add_task_comments(
+def add_task_comments(
     db: Session, comment: tasks_schemas.TaskCommentBase, user_data: AuthUser
 ):
     """Add a comment to a task.
@@ -299,6 +372,7 @@ async def add_task_comments(
     # Execute the query with the named parameters and commit the transaction
     result = db.execute(query, params)
     db.commit()
+    task_comments_cache.invalidate((comment.project_id, comment.task_id))
 
     # Fetch the first row of the query result
     row = result.fetchone()
@@ -313,33 +387,43 @@ async def add_task_comments(
     }
 
 
-async def update_task_history(
+def update_task_history(
     tasks: List[tasks_schemas.Task], db: Session = Depends(database.get_db)
 ):
     """Update task history with username and user profile image."""
+    history_entries = [
+        history_entry
+        for task in (tasks if isinstance(tasks, list) else [tasks])
+        if isinstance(task.task_history, list)
+        for history_entry in task.task_history
+    ]
 
-    def process_history_entry(history_entry):
-        status = history_entry.action_text.split()
-        history_entry.status = status[5]
-
-        if history_entry.user_id:
-            user = (
-                db.query(db_models.DbUser).filter_by(id=history_entry.user_id).first()
-            )
-            if user:
-                history_entry.username = user.username
-                history_entry.profile_img = user.profile_img
+    # Fetch users not already eager loaded in a single WHERE IN query,
+    # so the actioned_by lazy loads below resolve from the identity map
+    user_ids = {
+        history_entry.user_id
+        for history_entry in history_entries
+        if "actioned_by" in inspect(history_entry).unloaded
+    }
+    if user_ids:
+        db.query(db_models.DbUser).filter(db_models.DbUser.id.in_(user_ids)).all()
+
+    for history_entry in history_entries:
+        history_entry.status = (
+            history_entry.new_status.name
+            if history_entry.new_status
+            else history_entry.action_text
+        )
 
-    for task in tasks if isinstance(tasks, list) else [tasks]:
-        task_history = task.task_history
-        if isinstance(task_history, list):
-            for history_entry in task_history:
-                process_history_entry(history_entry)
+        user = history_entry.actioned_by
+        if user:
+            history_entry.username = user.username
+            history_entry.profile_img = user.profile_img
 
     return tasks
 
 
-async def get_project_task_history(
+def get_project_task_history(
     project_id: int,
     end_date: Optional[datetime],
     db: Session,
@@ -355,8 +439,20 @@ async def get_project_task_history(
     Returns:
         A list of task history records for the specified project.
     """
-    query = db.query(db_models.DbTaskHistory).filter(
-        db_models.DbTaskHistory.project_id == project_id
+    # Only the columns and user the TaskHistory schema reads
+    query = (
+        db.query(db_models.DbTaskHistory)
+        .options(
+            load_only(
+                db_models.DbTaskHistory.task_id,
+                db_models.DbTaskHistory.action_text,
+                db_models.DbTaskHistory.action_date,
+                db_models.DbTaskHistory.new_status,
+                db_models.DbTaskHistory.user_id,
+            ),
+            selectinload(db_models.DbTaskHistory.user),
+        )
+        .filter(db_models.DbTaskHistory.project_id == project_id)
     )
 
     if end_date:
@@ -365,13 +461,17 @@ async def get_project_task_history(
     return query.all()
 
 
-async def count_validated_and_mapped_tasks(
-    task_history: list[db_models.DbTaskHistory], end_date: datetime
+def count_validated_and_mapped_tasks(
+    db: Session, project_id: int, end_date: datetime
 ) -> list[tasks_schemas.TaskHistoryCount]:
     """Counts the number of validated and mapped tasks.
 
+    The daily counts and running totals are computed in the database,
+    returning one row per day rather than every history record.
+
     Args:
-        task_history: The task history records to count.
+        db (Session): The database session.
+        project_id (int): The ID of the project.
         end_date: The end date of the date range.
 
     Returns:
@@ -380,34 +480,32 @@ async def count_validated_and_mapped_tasks(
         - 'validated': The cumulative count of validated tasks.
         - 'mapped': The cumulative count of mapped tasks.
     """
-    cumulative_counts = {}
-    results = []
-
-    current_date = end_date
-    while current_date <= datetime.now():
-        date_str = current_date.strftime("%m/%d")
-        cumulative_counts = {"date": date_str, "validated": 0, "mapped": 0}
-        results.append(cumulative_counts)
-        current_date += timedelta(days=1)
-
-    # Populate cumulative_counts with counts from task_history
-    for result in task_history:
-        task_status = result.action_text.split()[5]
-        date_str = result.action_date.strftime("%m/%d")
-        entry = next((entry for entry in results if entry["date"] == date_str), None)
-
-        if entry:
-            if task_status == "VALIDATED":
-                entry["validated"] += 1
-            elif task_status == "MAPPED":
-                entry["mapped"] += 1
-
-    total_validated = 0
-    total_mapped = 0
-
-    for entry in results:
-        total_validated += entry["validated"]
-        total_mapped += entry["mapped"]
-        entry.update({"validated": total_validated, "mapped": total_mapped})
-
-    return results
+    query = text(
+        """
+        WITH daily AS (
+            SELECT
+                CAST(action_date AS date) AS day,
+                count(*) FILTER (WHERE new_status = 'VALIDATED') AS validated,
+                count(*) FILTER (WHERE new_status = 'MAPPED') AS mapped
+            FROM task_history
+            WHERE project_id = :project_id
+                AND action_date >= :end_date
+            GROUP BY day
+        )
+        SELECT
+            to_char(days.day, 'MM/DD') AS date,
+            sum(coalesce(daily.validated, 0)) OVER (ORDER BY days.day) AS validated,
+            sum(coalesce(daily.mapped, 0)) OVER (ORDER BY days.day) AS mapped
+        FROM generate_series(
+            CAST(:end_date AS date), CAST(now() AS date), interval '1 day'
+        ) AS days(day)
+        LEFT JOIN daily ON daily.day = CAST(days.day AS date)
+        ORDER BY days.day;
+    """
+    )
+    result = db.execute(query, {"project_id": project_id, "end_date": end_date})
+
+    return [
+        {"date": row.date, "validated": int(row.validated), "mapped": int(row.mapped)}
+        for row in result
+    ]
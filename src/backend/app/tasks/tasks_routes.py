@@ -21,6 +21,7 @@ from datetime import datetime, timedelta
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from loguru import logger as log
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import text
@@ -41,21 +42,21 @@ router = APIRouter(
 
 
 @router.get("/task-list", response_model=List[tasks_schemas.ReadTask])
-async def read_task_list(
+def read_task_list(
     project_id: int,
     limit: int = 1000,
     db: Session = Depends(database.get_db),
 ):
     """Get the task list for a project."""
-    tasks = await tasks_crud.get_tasks(db, project_id, limit)
-    updated_tasks = await tasks_crud.update_task_history(tasks, db)
+    tasks = tasks_crud.get_tasks(db, project_id, limit)
+    updated_tasks = tasks_crud.update_task_history(tasks, db)
     if not tasks:
         raise HTTPException(status_code=404, detail="Tasks not found")
     return updated_tasks
 
 
 @router.get("/", response_model=List[tasks_schemas.Task])
-async def read_tasks(
+def read_tasks(
     project_id: int,
     user_id: int = None,
     skip: int = 0,
@@ -69,7 +70,7 @@ async def read_tasks(
             detail="Please provide either user_id OR task_id, not both.",
         )
 
-    tasks = await tasks_crud.get_tasks(db, project_id, user_id, skip, limit)
+    tasks = tasks_crud.get_tasks(db, project_id, user_id, skip, limit)
     if not tasks:
         raise HTTPException(status_code=404, detail="Tasks not found")
     return tasks
@@ -113,9 +114,9 @@ async def get_tasks_near_me(
 
 
 @router.get("/{task_id}", response_model=tasks_schemas.Task)
-async def get_specific_task(task_id: int, db: Session = Depends(database.get_db)):
+def get_specific_task(task_id: int, db: Session = Depends(database.get_db)):
     """Get a specific task by it's ID."""
-    task = await tasks_crud.get_task(db, task_id)
+    task = tasks_crud.get_task(db, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     return task
@@ -132,13 +133,30 @@ async def update_task_status(
 ):
     """Update the task status."""
     user_id = await get_uid(current_user)
-    task = await tasks_crud.update_task_status(db, user_id, task_id, new_status)
-    updated_task = await tasks_crud.update_task_history(task, db)
+    task = await run_in_threadpool(
+        tasks_crud.update_task_status, db, user_id, task_id, new_status
+    )
+    updated_task = await run_in_threadpool(tasks_crud.update_task_history, task, db)
     if not task:
         raise HTTPException(status_code=404, detail="Task status could not be updated.")
     return updated_task
 
 
+@router.post("/bulk_status", response_model=List[tasks_schemas.ReadTask])
+async def update_task_status_bulk(
+    project_id: int,
+    status_updates: List[tasks_schemas.TaskStatusUpdate],
+    db: Session = Depends(database.get_db),
+    current_user: AuthUser = Depends(mapper),
+):
+    """Update the status of multiple tasks in a project at once."""
+    user_id = await get_uid(current_user)
+    tasks = await run_in_threadpool(
+        tasks_crud.update_task_status_bulk, db, user_id, project_id, status_updates
+    )
+    return await run_in_threadpool(tasks_crud.update_task_history, tasks, db)
+
+
 @router.get("/features/")
 async def task_features_count(
     project_id: int,
@@ -191,7 +209,7 @@ async def task_features_count(
 
 
 @router.get("/task-comments/", response_model=list[tasks_schemas.TaskCommentResponse])
-async def task_comments(
+def task_comments(
     project_id: int,
     task_id: int,
     db: Session = Depends(database.get_db),
@@ -206,13 +224,13 @@ async def task_comments(
     Returns:
         List[tasks_schemas.TaskCommentResponse]: A list of task comments.
     """
-    task_comment_list = await tasks_crud.get_task_comments(db, project_id, task_id)
+    task_comment_list = tasks_crud.get_task_comments(db, project_id, task_id)
 
     return task_comment_list
 
 
 @router.post("/task-comments/", response_model=tasks_schemas.TaskCommentResponse)
-async def add_task_comments(
+def add_task_comments(
     comment: tasks_schemas.TaskCommentRequest,
     db: Session = Depends(database.get_db),
     user_data: AuthUser = Depends(login_required),
@@ -227,12 +245,12 @@ async def add_task_comments(
     Returns:
         TaskCommentResponse: The created task comment.
     """
-    task_comment_list = await tasks_crud.add_task_comments(db, comment, user_data)
+    task_comment_list = tasks_crud.add_task_comments(db, comment, user_data)
     return task_comment_list
 
 
 @router.get("/activity/", response_model=List[tasks_schemas.TaskHistoryCount])
-async def task_activity(
+def task_activity(
     project_id: int, days: int = 10, db: Session = Depends(database.get_db)
 ):
     """Retrieves the validate and mapped task count for a specific project.
@@ -248,16 +266,11 @@ async def task_activity(
 
     """
     end_date = datetime.now() - timedelta(days=days)
-    task_history = await tasks_crud.get_project_task_history(project_id, end_date, db)
-
-    return await tasks_crud.count_validated_and_mapped_tasks(
-        task_history,
-        end_date,
-    )
+    return tasks_crud.count_validated_and_mapped_tasks(db, project_id, end_date)
 
 
 @router.get("/task_history/", response_model=List[tasks_schemas.TaskHistory])
-async def task_history(
+def task_history(
     project_id: int, days: int = 10, db: Session = Depends(database.get_db)
 ):
     """Get the detailed task history for a project.
@@ -272,4 +285,4 @@ async def task_history(
         List[TaskHistory]: A list of task history.
     """
     end_date = datetime.now() - timedelta(days=days)
-    return await tasks_crud.get_project_task_history(project_id, end_date, db)
+    return tasks_crud.get_project_task_history(project_id, end_date, db)
@@ -46,6 +46,13 @@ class TaskHistoryOut(TaskHistoryBase):
     profile_img: Optional[str]
 
 
+class TaskStatusUpdate(BaseModel):
+    """A requested status change for a single task."""
+
+    task_id: int
+    new_status: TaskStatus
+
+
 class TaskHistoryCount(BaseModel):
     """Task mapping history display."""
 
@@ -171,6 +178,7 @@ class TaskHistory(BaseModel):
 
     # Excluded
     user: Any = Field(exclude=True)
+    new_status: Optional[TaskStatus] = Field(default=None, exclude=True)
 
     task_id: int
     action_text: str
@@ -195,7 +203,9 @@ class TaskHistory(BaseModel):
     @computed_field
     @property
     def status(self) -> Optional[str]:
-        """Extract status from standard format action_text."""
+        """Get status from new_status, else from standard format action_text."""
+        if self.new_status:
+            return self.new_status.name
         if self.action_text:
             split_text = self.action_text.split()
             if len(split_text) > 5:
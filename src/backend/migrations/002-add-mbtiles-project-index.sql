@@ -0,0 +1,11 @@
+-- ## Migration to:
+-- * Add index on mbtiles_path (project_id, id DESC) for paginated tile lists
+
+-- Start a transaction
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_mbtiles_path_project_id
+ON public.mbtiles_path USING btree (project_id, id DESC);
+
+-- Commit the transaction
+COMMIT;
@@ -0,0 +1,14 @@
+-- ## Migration to:
+-- * Enable the pg_trgm extension
+-- * Add trigram index on project_info.name for project search
+
+-- Start a transaction
+BEGIN;
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA public;
+
+CREATE INDEX IF NOT EXISTS idx_project_info_name_trgm
+ON public.project_info USING gin (name gin_trgm_ops);
+
+-- Commit the transaction
+COMMIT;
@@ -0,0 +1,13 @@
+-- ## Migration to:
+-- * Add unique index on lower(project_info.name)
+--   NOTE fails if existing project names differ only by case,
+--   rename those projects first
+
+-- Start a transaction
+BEGIN;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_project_info_name_lower
+ON public.project_info USING btree (lower(name));
+
+-- Commit the transaction
+COMMIT;
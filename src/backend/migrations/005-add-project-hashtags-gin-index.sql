@@ -0,0 +1,11 @@
+-- ## Migration to:
+-- * Add GIN index on projects.hashtags, for && (overlap) filters
+
+-- Start a transaction
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_projects_hashtags
+ON public.projects USING gin (hashtags);
+
+-- Commit the transaction
+COMMIT;
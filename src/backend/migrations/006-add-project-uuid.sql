@@ -0,0 +1,12 @@
+-- ## Migration to:
+-- * Add projects.project_uuid, a stable UUID per project
+--   NOTE existing projects each get a random UUID
+
+-- Start a transaction
+BEGIN;
+
+ALTER TABLE IF EXISTS public.projects
+ADD COLUMN IF NOT EXISTS project_uuid uuid NOT NULL DEFAULT gen_random_uuid();
+
+-- Commit the transaction
+COMMIT;
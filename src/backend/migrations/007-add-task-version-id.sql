@@ -0,0 +1,12 @@
+-- ## Migration to:
+-- * Add tasks.version_id, a row version for optimistic locking
+--   NOTE existing tasks start at version 1
+
+-- Start a transaction
+BEGIN;
+
+ALTER TABLE IF EXISTS public.tasks
+ADD COLUMN IF NOT EXISTS version_id integer NOT NULL DEFAULT 1;
+
+-- Commit the transaction
+COMMIT;
@@ -0,0 +1,11 @@
+-- ## Migration to:
+-- * Add index on task_history (project_id, action_date), for activity by date
+
+-- Start a transaction
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_task_history_project_id_action_date
+ON public.task_history USING btree (project_id, action_date);
+
+-- Commit the transaction
+COMMIT;
@@ -0,0 +1,20 @@
+-- ## Migration to:
+-- * Add task_history.new_status, the status a task changed to
+--   NOTE backfilled from the 'Status changed from X to Y by: user' text
+
+-- Start a transaction
+BEGIN;
+
+ALTER TABLE IF EXISTS public.task_history
+ADD COLUMN IF NOT EXISTS new_status public.taskstatus;
+
+UPDATE public.task_history
+SET new_status = CAST(split_part(action_text, ' ', 6) AS public.taskstatus)
+WHERE new_status IS NULL
+    AND action_text LIKE 'Status changed from % to % by: %'
+    AND split_part(action_text, ' ', 6) = ANY(
+        CAST(enum_range(NULL::public.taskstatus) AS text[])
+    );
+
+-- Commit the transaction
+COMMIT;
@@ -0,0 +1,12 @@
+-- ## Migration to:
+-- * Add partial index on task_history (project_id, task_id) for comments
+
+-- Start a transaction
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_task_history_comments
+ON public.task_history USING btree (project_id, task_id)
+WHERE action = 'COMMENT';
+
+-- Commit the transaction
+COMMIT;
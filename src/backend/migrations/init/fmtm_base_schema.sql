@@ -36,6 +36,7 @@ CREATE SCHEMA topology;
 ALTER SCHEMA topology OWNER TO fmtm;
 
 CREATE EXTENSION IF NOT EXISTS fuzzystrmatch WITH SCHEMA public; 
+CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA public;
 CREATE EXTENSION IF NOT EXISTS postgis WITH SCHEMA public;
 CREATE EXTENSION IF NOT EXISTS postgis_tiger_geocoder WITH SCHEMA tiger;
 CREATE EXTENSION IF NOT EXISTS postgis_topology WITH SCHEMA topology;
@@ -371,7 +372,8 @@ CREATE TABLE public.projects (
     task_split_type public.tasksplittype,
     task_split_dimension smallint,
     task_num_buildings smallint,
-    hashtags character varying[]
+    hashtags character varying[],
+    project_uuid uuid NOT NULL DEFAULT gen_random_uuid()
 );
 ALTER TABLE public.projects OWNER TO fmtm;
 CREATE SEQUENCE public.projects_id_seq
@@ -392,7 +394,8 @@ CREATE TABLE public.task_history (
     action public.taskaction NOT NULL,
     action_text character varying,
     action_date timestamp without time zone NOT NULL,
-    user_id bigint NOT NULL
+    user_id bigint NOT NULL,
+    new_status public.taskstatus
 );
 ALTER TABLE public.task_history OWNER TO fmtm;
 CREATE SEQUENCE public.task_history_id_seq
@@ -463,7 +466,8 @@ CREATE TABLE public.tasks (
     locked_by bigint,
     mapped_by bigint,
     validated_by bigint,
-    odk_token character varying
+    odk_token character varying,
+    version_id integer NOT NULL DEFAULT 1
 );
 ALTER TABLE public.tasks OWNER TO fmtm;
 CREATE SEQUENCE public.tasks_id_seq
@@ -656,8 +660,11 @@ ALTER TABLE ONLY public.xlsforms
 CREATE INDEX idx_geometry ON public.projects USING gist (outline);
 CREATE INDEX idx_projects_centroid ON public.projects USING gist (centroid);
 CREATE INDEX idx_projects_outline ON public.projects USING gist (outline);
+CREATE INDEX idx_projects_hashtags ON public.projects USING gin (hashtags);
 CREATE INDEX idx_task_history_composite ON public.task_history USING btree (task_id, project_id);
 CREATE INDEX idx_task_history_project_id_user_id ON public.task_history USING btree (user_id, project_id);
+CREATE INDEX idx_task_history_project_id_action_date ON public.task_history USING btree (project_id, action_date);
+CREATE INDEX idx_task_history_comments ON public.task_history USING btree (project_id, task_id) WHERE (action = 'COMMENT'::public.taskaction);
 CREATE INDEX idx_task_validation_history_composite ON public.task_invalidation_history USING btree (task_id, project_id);
 CREATE INDEX idx_task_validation_mapper_status_composite ON public.task_invalidation_history USING btree (mapper_id, is_closed);
 CREATE INDEX idx_task_validation_validator_status_composite ON public.task_invalidation_history USING btree (invalidator_id, is_closed);
@@ -674,8 +681,11 @@ CREATE INDEX ix_tasks_project_id ON public.tasks USING btree (project_id);
 CREATE INDEX ix_tasks_validated_by ON public.tasks USING btree (validated_by);
 CREATE INDEX ix_users_id ON public.users USING btree (id);
 CREATE INDEX textsearch_idx ON public.project_info USING btree (text_searchable);
+CREATE INDEX idx_project_info_name_trgm ON public.project_info USING gin (name gin_trgm_ops);
+CREATE UNIQUE INDEX idx_project_info_name_lower ON public.project_info USING btree (lower(name));
 CREATE INDEX idx_user_roles ON public.user_roles USING btree (project_id, user_id);
 CREATE INDEX idx_org_managers ON public.organisation_managers USING btree (user_id, organisation_id);
+CREATE INDEX idx_mbtiles_path_project_id ON public.mbtiles_path USING btree (project_id, id DESC);
 
 -- Foreign keys
 
@@ -0,0 +1,7 @@
+-- Start a transaction
+BEGIN;
+
+DROP INDEX IF EXISTS public.idx_mbtiles_path_project_id;
+
+-- Commit the transaction
+COMMIT;
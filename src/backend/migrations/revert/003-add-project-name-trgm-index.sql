@@ -0,0 +1,7 @@
+-- Start a transaction
+BEGIN;
+
+DROP INDEX IF EXISTS public.idx_project_info_name_trgm;
+
+-- Commit the transaction
+COMMIT;
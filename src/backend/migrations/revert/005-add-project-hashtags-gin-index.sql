@@ -0,0 +1,7 @@
+-- Start a transaction
+BEGIN;
+
+DROP INDEX IF EXISTS public.idx_projects_hashtags;
+
+-- Commit the transaction
+COMMIT;
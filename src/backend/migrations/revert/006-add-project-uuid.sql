@@ -0,0 +1,8 @@
+-- Start a transaction
+BEGIN;
+
+ALTER TABLE IF EXISTS public.projects
+DROP COLUMN IF EXISTS project_uuid;
+
+-- Commit the transaction
+COMMIT;
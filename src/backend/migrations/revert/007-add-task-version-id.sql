@@ -0,0 +1,8 @@
+-- Start a transaction
+BEGIN;
+
+ALTER TABLE IF EXISTS public.tasks
+DROP COLUMN IF EXISTS version_id;
+
+-- Commit the transaction
+COMMIT;
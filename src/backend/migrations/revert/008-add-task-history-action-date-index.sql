@@ -0,0 +1,7 @@
+-- Start a transaction
+BEGIN;
+
+DROP INDEX IF EXISTS public.idx_task_history_project_id_action_date;
+
+-- Commit the transaction
+COMMIT;
@@ -0,0 +1,8 @@
+-- Start a transaction
+BEGIN;
+
+ALTER TABLE IF EXISTS public.task_history
+DROP COLUMN IF EXISTS new_status;
+
+-- Commit the transaction
+COMMIT;
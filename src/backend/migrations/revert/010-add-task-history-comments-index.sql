@@ -0,0 +1,7 @@
+-- Start a transaction
+BEGIN;
+
+DROP INDEX IF EXISTS public.idx_task_history_comments;
+
+-- Commit the transaction
+COMMIT;
@@ -35,9 +35,9 @@ from app.auth.osm import AuthUser
 from app.central import central_crud
 from app.config import settings
 from app.db.database import Base, get_db
-from app.db.db_models import DbOrganisation
+from app.db.db_models import DbOrganisation, DbTask
 from app.main import get_application
-from app.models.enums import CommunityType, UserRole
+from app.models.enums import CommunityType, TaskStatus, UserRole
 from app.projects import project_crud
 from app.projects.project_schemas import ODKCentralDecrypted, ProjectInfo, ProjectUpload
 
@@ -78,8 +78,9 @@ def db(db_engine):
     # begin a non-ORM transaction
     connection.begin()
 
-    # bind an individual Session to the connection
-    db = TestingSessionLocal(bind=connection)
+    # bind an individual Session to the connection, using savepoints so
+    # commit and rollback inside the code under test stay in this transaction
+    db = TestingSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
 
     yield db
 
@@ -189,6 +190,22 @@ async def project(db, admin_user, organisation):
     return new_project
 
 
+@pytest.fixture(scope="function")
+def tasks(db, project):
+    """Two READY tasks in the test project."""
+    db_tasks = [
+        DbTask(
+            project_id=project.id,
+            project_task_index=index,
+            task_status=TaskStatus.READY,
+        )
+        for index in (1, 2)
+    ]
+    db.add_all(db_tasks)
+    db.commit()
+    return db_tasks
+
+
 # @pytest.fixture(scope="function")
 # def get_ids(db, project):
 #     user_id_query = text(f"SELECT id FROM {DbUser.__table__.name} LIMIT 1")
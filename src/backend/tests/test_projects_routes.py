@@ -26,17 +26,23 @@ from pathlib import Path
 from random import randint
 from unittest.mock import Mock, patch
 
+import geojson
 import pytest
 import requests
 from fastapi.concurrency import run_in_threadpool
 from geoalchemy2.elements import WKBElement
 from loguru import logger as log
 from shapely import Polygon
+from sqlalchemy import text
 
 from app.central.central_crud import create_odk_project, read_and_test_xform
 from app.config import encrypt_value, settings
 from app.db import db_models
-from app.db.postgis_utils import split_geojson_by_task_areas
+from app.db.postgis_utils import (
+    flatgeobuf_to_geojson_stream,
+    geojson_to_flatgeobuf,
+    split_geojson_by_task_areas,
+)
 from app.projects import project_crud, project_schemas
 from app.tasks import tasks_crud
 from tests.test_data import test_data_path
@@ -153,6 +159,34 @@ async def test_create_project_with_project_info(db, project):
     assert isinstance(project.project_name_prefix, str)
 
 
+async def test_read_project_not_modified(client, project):
+    """Test a matching If-None-Match returns 304 without the project body."""
+    response = client.get(f"/projects/{project.id}")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = client.get(f"/projects/{project.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+
+async def test_read_project_modified_by_comment(client, project, tasks):
+    """Test a new task comment changes the project ETag."""
+    response = client.get(f"/projects/{project.id}")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = client.post(
+        "/tasks/task-comments/",
+        json={"task_id": tasks[0].id, "project_id": project.id, "comment": "Test"},
+    )
+    assert response.status_code == 200
+
+    response = client.get(f"/projects/{project.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
 async def test_upload_data_extracts(client, project):
     """Test uploading data extracts in GeoJSON and flatgeobuf formats."""
     # Flatgeobuf
@@ -201,6 +235,34 @@ async def test_upload_data_extracts(client, project):
     #     data_extracts = zip_archive.read("building_foot_jnk.geojson")
 
 
+async def test_upload_invalid_file_extension(client):
+    """Test uploads with an invalid extension are rejected before parsing."""
+    response = client.post(
+        "/projects/preview-split-by-square/",
+        files={"project_geojson": ("file.txt", BytesIO(b"not geojson"))},
+        data={"dimension": 100},
+    )
+
+    assert response.status_code == 400
+    assert ".geojson" in response.json()["detail"]
+
+
+async def test_flatgeobuf_to_geojson_stream(db):
+    """Test streaming flatgeobuf features as GeoJSON, without a leftover table."""
+    with open(f"{test_data_path}/data_extract_kathmandu.geojson", "r") as f:
+        data_extract = geojson.load(f)
+    flatgeobuf = await geojson_to_flatgeobuf(db, data_extract)
+
+    chunks = await flatgeobuf_to_geojson_stream(db, flatgeobuf)
+    feature_collection = json.loads(b"".join(chunks))
+    assert len(feature_collection["features"]) == len(data_extract["features"])
+
+    temp_tables = db.execute(
+        text("SELECT count(*) FROM pg_tables WHERE tablename LIKE 'temp_fgb_%'")
+    ).scalar()
+    assert temp_tables == 0
+
+
 async def test_generate_project_files(db, client, project):
     """Test generate all appuser files (during creation)."""
     odk_credentials = {
@@ -270,7 +332,7 @@ async def test_generate_project_files(db, client, project):
     assert split_extract_dict is not None
 
     # Get project tasks list (no longer required)
-    task_ids = await tasks_crud.get_task_id_list(db, project_id)
+    task_ids = tasks_crud.get_task_id_list(db, project_id)
     assert isinstance(task_ids, list)
 
     # Provide custom xlsform file path
@@ -322,6 +384,18 @@ async def test_generate_project_files(db, client, project):
     assert result is None
 
 
+async def test_project_files_pool(client):
+    """Test a job runs in the project files worker processes.
+
+    Starting a worker pickles the app logger, so fails on unpicklable sinks.
+    """
+    record = {"extra": {"task": "create_project"}}
+    future = project_crud.project_files_pool().submit(
+        project_crud.create_project_log_filter, record
+    )
+    assert future.result(timeout=60) is True
+
+
 # async def test_update_project_boundary(db, project):
 #     """Test updating project boundary."""
 #     project_id = project.id
@@ -0,0 +1,164 @@
+# Copyright (c) 2022, 2023 Humanitarian OpenStreetMap Team
+#
+# This file is part of FMTM.
+#
+#     FMTM is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     FMTM is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with FMTM.  If not, see <https:#www.gnu.org/licenses/>.
+#
+"""Tests for task routes."""
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.auth.auth_routes import get_or_create_user
+from app.auth.osm import AuthUser
+from app.db import db_models
+from app.models.enums import TaskStatus, UserRole
+from app.tasks import tasks_crud
+
+
+def task_history_count(db, project_id: int) -> int:
+    """Count the task history entries persisted for a project."""
+    return (
+        db.query(db_models.DbTaskHistory)
+        .filter(db_models.DbTaskHistory.project_id == project_id)
+        .count()
+    )
+
+
+async def test_bulk_task_status(client, db, project, tasks):
+    """Test updating the status of several tasks in one request."""
+    response = client.post(
+        "/tasks/bulk_status",
+        params={"project_id": project.id},
+        json=[
+            {"task_id": task.id, "new_status": TaskStatus.LOCKED_FOR_MAPPING}
+            for task in tasks
+        ],
+    )
+    assert response.status_code == 200
+    assert [task["task_status"] for task in response.json()] == [
+        TaskStatus.LOCKED_FOR_MAPPING,
+        TaskStatus.LOCKED_FOR_MAPPING,
+    ]
+
+    db.expire_all()
+    assert all(task.task_status == TaskStatus.LOCKED_FOR_MAPPING for task in tasks)
+    assert task_history_count(db, project.id) == 2
+
+
+async def test_bulk_task_status_other_project_task(
+    client, db, admin_user, organisation, project, tasks
+):
+    """Test a batch with a task from another project is rejected as a whole."""
+    other_project = db_models.DbProject(
+        author_id=admin_user.id, organisation_id=organisation.id
+    )
+    db.add(other_project)
+    db.commit()
+    other_task = db_models.DbTask(
+        project_id=other_project.id, project_task_index=1, task_status=TaskStatus.READY
+    )
+    db.add(other_task)
+    db.commit()
+
+    response = client.post(
+        "/tasks/bulk_status",
+        params={"project_id": project.id},
+        json=[
+            {"task_id": tasks[0].id, "new_status": TaskStatus.LOCKED_FOR_MAPPING},
+            {"task_id": other_task.id, "new_status": TaskStatus.LOCKED_FOR_MAPPING},
+        ],
+    )
+    assert response.status_code == 404
+
+    db.expire_all()
+    assert tasks[0].task_status == TaskStatus.READY
+    assert other_task.task_status == TaskStatus.READY
+    assert task_history_count(db, project.id) == 0
+
+
+async def test_bulk_task_status_invalid_transition(client, db, project, tasks):
+    """Test an invalid transition leaves the other tasks in the batch untouched."""
+    response = client.post(
+        "/tasks/bulk_status",
+        params={"project_id": project.id},
+        json=[
+            {"task_id": tasks[0].id, "new_status": TaskStatus.LOCKED_FOR_MAPPING},
+            {"task_id": tasks[1].id, "new_status": TaskStatus.VALIDATED},
+        ],
+    )
+    assert response.status_code == 422
+
+    db.expire_all()
+    assert all(task.task_status == TaskStatus.READY for task in tasks)
+    assert task_history_count(db, project.id) == 0
+
+
+async def test_update_task_status_concurrent_change(db, admin_user, tasks):
+    """Test a status change based on a stale copy of the task is rejected."""
+    task_id = tasks[0].id
+
+    # A second session on the test connection, keeping its copy of the task
+    # (version 1) after commit, as a concurrent request would
+    stale_db = Session(
+        bind=db.get_bind(),
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    )
+    stale_task = tasks_crud.get_task(stale_db, task_id)
+    assert stale_task.task_status == TaskStatus.READY
+    stale_db.commit()
+
+    tasks_crud.update_task_status(
+        db, admin_user.id, task_id, TaskStatus.LOCKED_FOR_MAPPING
+    )
+
+    with pytest.raises(HTTPException) as error:
+        tasks_crud.update_task_status(stale_db, admin_user.id, task_id, TaskStatus.BAD)
+    assert error.value.status_code == 409
+    stale_db.close()
+
+    db.expire_all()
+    assert tasks_crud.get_task(db, task_id).task_status == (
+        TaskStatus.LOCKED_FOR_MAPPING
+    )
+    history = (
+        db.query(db_models.DbTaskHistory)
+        .filter(db_models.DbTaskHistory.task_id == task_id)
+        .all()
+    )
+    assert [entry.new_status for entry in history] == [TaskStatus.LOCKED_FOR_MAPPING]
+
+
+async def test_update_task_status_locked_by_other_user(client, db, project, tasks):
+    """Test only the user holding a task lock can change its status."""
+    lock_holder = await get_or_create_user(
+        db, AuthUser(username="test_lock_holder", id=30000001, role=UserRole.MAPPER)
+    )
+    task_id = tasks[0].id
+    tasks_crud.update_task_status(
+        db, lock_holder.id, task_id, TaskStatus.LOCKED_FOR_MAPPING
+    )
+
+    # The test client is logged in as the admin user, not the lock holder
+    response = client.post(
+        f"/tasks/{task_id}/new_status/{TaskStatus.MAPPED.value}",
+        params={"project_id": project.id},
+    )
+    assert response.status_code == 403
+
+    task = tasks_crud.update_task_status(db, lock_holder.id, task_id, TaskStatus.MAPPED)
+    assert task.task_status == TaskStatus.MAPPED
+    assert task.mapped_by == lock_holder.id